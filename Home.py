@@ -1,5 +1,9 @@
 import streamlit as st
 
+from cdss import metrics
+from cdss import perf
+from cdss import style
+
 # Page configuration - This replaces all the st.set_page_config() in your individual files
 st.set_page_config(
     page_title="Psoriasis Clinical Decision Support System",
@@ -8,92 +12,17 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Professional CSS styling
-st.markdown("""
-    <style>
-    /* Main header styling */
-    .main-header {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 2rem;
-        border-radius: 10px;
-        color: white;
-        text-align: center;
-        margin-bottom: 2rem;
-        box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-    }
-    
-    .main-header h1 {
-        margin: 0;
-        font-size: 2.5rem;
-        font-weight: 700;
-    }
-    
-    .main-header p {
-        margin: 0.5rem 0 0 0;
-        font-size: 1.2rem;
-        opacity: 0.9;
-    }
-    
-    /* Module card styling */
-    .module-card {
-        background: white;
-        padding: 1.5rem;
-        border-radius: 10px;
-        border-left: 4px solid #667eea;
-        margin-bottom: 1rem;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        transition: transform 0.2s, box-shadow 0.2s;
-    }
-    
-    .module-card:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 4px 8px rgba(0,0,0,0.15);
-    }
-    
-    .module-card h4 {
-        color: #667eea;
-        margin-top: 0;
-    }
-    
-    .module-card p {
-        color: #666;
-        margin-bottom: 0;
-    }
-    
-    /* Info box styling */
-    .info-box {
-        background: #f0f7ff;
-        border-left: 4px solid #2196F3;
-        padding: 1rem;
-        border-radius: 5px;
-        margin: 1rem 0;
-    }
-    
-    /* Feature list styling */
-    .feature-list {
-        list-style: none;
-        padding-left: 0;
-    }
-    
-    .feature-list li {
-        padding: 0.5rem 0;
-        padding-left: 1.5rem;
-        position: relative;
-    }
-    
-    .feature-list li:before {
-        content: "✓";
-        color: #4CAF50;
-        font-weight: bold;
-        position: absolute;
-        left: 0;
-    }
-    </style>
-""", unsafe_allow_html=True)
+# Rerun timing, element count and payload size; ?diagnostics=1 shows them (cdss/perf.py)
+# and /metrics on CDSS_METRICS_PORT exports them (cdss/metrics.py)
+metrics.start_exporter()
+perf.start_page("home")
+
+# Shared stylesheet (cdss/styles.css); the page marker scopes page-specific rules
+st.markdown(style.page_style("home"), unsafe_allow_html=True)
 
 # Main header
 st.markdown("""
-    <div class="main-header">
+    <div class="main-header home">
         <h1>🩺 Psoriasis Clinical Decision Support System</h1>
         <p>Comprehensive Assessment & Treatment Guidance Platform</p>
     </div>
@@ -207,7 +136,7 @@ with col3:
 st.write("### ✨ Key Features")
 
 st.markdown("""
-<ul class="feature-list">
+<ul class="feature-list home">
     <li>Evidence-based diagnostic criteria and assessment tools</li>
     <li>Interactive visual assessment with clinical images</li>
     <li>Automated scoring and severity classification</li>
@@ -254,3 +183,5 @@ with col3:
     st.caption("Psoriasis CDSS v1.0 | October 2025")
 
 st.caption("For Clinical Research and Educational Purposes")
+
+perf.end_page()
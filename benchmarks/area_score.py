@@ -0,0 +1,72 @@
+"""Benchmark PASI area scoring: if/elif chain versus lookup table
+
+    python -m benchmarks.area_score [--rows N]
+"""
+import argparse
+import timeit
+
+import numpy as np
+
+from cdss.pasi import area_score, area_to_score
+
+
+def branchy_area_score(percentage):
+    """The original convert_area_to_score if/elif chain, kept as the reference"""
+    if percentage == 0:
+        return 0
+    elif percentage < 10:
+        return 1
+    elif percentage <= 29:
+        return 2
+    elif percentage <= 49:
+        return 3
+    elif percentage <= 69:
+        return 4
+    elif percentage <= 89:
+        return 5
+    else:
+        return 6
+
+
+def best_of(stmt, number, repeat=5):
+    """Best wall time in seconds for one execution of stmt"""
+    return min(timeit.repeat(stmt, number=number, repeat=repeat)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000, help="percentages per batch")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    whole = rng.integers(0, 101, args.rows)
+    fractional = rng.uniform(0, 100, args.rows)
+    fractional[::7] = np.round(fractional[::7])  # exercise the band edges too
+
+    # The lookup table must agree with the chain everywhere before timing it
+    edges = np.array([0, 9, 9.999, 10, 29, 29.0001, 49, 49.5, 69, 69.5, 89, 89.5, 100])
+    for values in (np.arange(101), edges, fractional[:10_000]):
+        expected = [branchy_area_score(v) for v in values.tolist()]
+        assert area_to_score(values).tolist() == expected
+        assert [area_score(v) for v in values.tolist()] == expected
+
+    whole_list = whole.tolist()
+    fractional_list = fractional.tolist()
+    n = args.rows
+    rows = [
+        ("scalar chain, whole %", best_of(lambda: [branchy_area_score(v) for v in whole_list], 1)),
+        ("scalar table, whole %", best_of(lambda: [area_score(v) for v in whole_list], 1)),
+        ("scalar chain, fractional %", best_of(lambda: [branchy_area_score(v) for v in fractional_list], 1)),
+        ("scalar table, fractional %", best_of(lambda: [area_score(v) for v in fractional_list], 1)),
+        ("array take, whole %", best_of(lambda: area_to_score(whole), 5)),
+        ("array searchsorted, fractional %", best_of(lambda: area_to_score(fractional), 5)),
+    ]
+
+    baseline = rows[0][1]
+    print(f"{'case':<34}{'ns/value':>10}{'Mvalues/s':>11}{'speedup':>9}")
+    for name, seconds in rows:
+        print(f"{name:<34}{seconds / n * 1e9:>10.1f}{n / seconds / 1e6:>11.2f}{baseline / seconds:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""Benchmark the DLQI domain chart: building the figure versus the shared cache
+
+    python -m benchmarks.dlqi_chart [--repeat N] [--sessions N]
+
+"build" is what every rerun of the DLQI section used to pay; "cached" is a
+hit in charts.dlqi_domain_figure. "serialize" is plotly.io.to_json, which
+st.plotly_chart runs on every call either way.
+
+The hit rates count only each session's first scoring of --sessions random
+questionnaires, at several cache sizes: a later rerun of the same session
+always hits, so only first scorings show reuse across sessions. With the
+memory per cached figure, this is the figure to size
+charts.DLQI_FIGURE_CACHE_SIZE from.
+"""
+import argparse
+import random
+import timeit
+import tracemalloc
+from functools import lru_cache
+
+from cdss import charts
+from cdss import dlqi
+
+
+def domain_scores(answers):
+    """(domain, score) pairs for one answer row, as the severity page builds them"""
+    result = dlqi.score_dlqi([answers])
+    return tuple(
+        (domain, int(result['domain_scores'][0, j]))
+        for j, domain in enumerate(result['domains'])
+        if result['domain_answered'][0, j]
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=50)
+    parser.add_argument('--sessions', type=int, default=20000, help="simulated questionnaires")
+    args = parser.parse_args()
+
+    import plotly.io
+
+    scores = domain_scores([2, 1, 0, 3, 1, 0, 2, 1, 0, 1])
+    build = charts.dlqi_domain_figure.__wrapped__
+    build(scores)  # import plotly.express outside the timings
+    charts.dlqi_domain_figure(scores)
+    fig = build(scores)
+
+    timings = {
+        'build': min(timeit.repeat(lambda: build(scores), number=1, repeat=args.repeat)),
+        'cached': min(timeit.repeat(lambda: charts.dlqi_domain_figure(scores), number=1, repeat=args.repeat)),
+        'serialize': min(timeit.repeat(lambda: plotly.io.to_json(fig, validate=False), number=1, repeat=args.repeat)),
+    }
+    print(f"{'per rerun':<12}{'us':>10}")
+    for name, seconds in timings.items():
+        print(f"{name:<12}{seconds * 1e6:>10.1f}")
+
+    rng = random.Random(0)
+    keys = [domain_scores([rng.randrange(4) for _ in range(10)]) for _ in range(args.sessions)]
+    tracemalloc.start()
+    held = [build(key) for key in keys[:100]]
+    per_figure = tracemalloc.get_traced_memory()[0] / len(held)
+    tracemalloc.stop()
+    del held
+
+    print()
+    print(f"{len(set(keys))} distinct domain scores in {args.sessions} first scorings, "
+          f"{per_figure / 1024:.0f} KB per cached figure")
+    print(f"{'cache size':<12}{'hit rate':>10}{'memory MB':>11}")
+    for size in sorted({64, 256, 512, 2048, charts.DLQI_FIGURE_CACHE_SIZE}):
+        # Same LRU policy and size as the real cache, without building figures
+        cache = lru_cache(maxsize=size)(lambda key: None)
+        for key in keys:
+            cache(key)
+        info = cache.cache_info()
+        marker = "  (charts.DLQI_FIGURE_CACHE_SIZE)" if size == charts.DLQI_FIGURE_CACHE_SIZE else ""
+        print(f"{size:<12}{info.hits / len(keys):>10.1%}{size * per_figure / 2 ** 20:>11.0f}{marker}")
+
+
+if __name__ == '__main__':
+    main()
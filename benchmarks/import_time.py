@@ -0,0 +1,117 @@
+"""Report which heavy libraries each page imports and what its first run costs
+
+    python -m benchmarks.import_time [--repeat N]
+
+Each page, and each Severity Assessment section, runs once through
+Streamlit's AppTest in a fresh interpreter, the way a newly started worker
+pays for imports on its first render. The report lists the heavy modules
+that run pulled in and the time of the first script run (best of N). The
+first table is each heavy module's own import time on top of streamlit,
+from python -X importtime.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ("numpy", "pandas", "plotly.express", "PIL.Image")
+
+SEVERITY_PAGE = "pages/4_Severity_Assessment.py"
+SEVERITY_SECTIONS = (
+    "Psoriasis Overview",
+    "PASI Scoring System",
+    "BSA Assessment",
+    "DLQI Evaluation",
+    "Treatment Recommendations",
+    "Clinical Reference"
+)
+TARGETS = (
+    ("Home.py", None),
+    ("pages/1_Patient_Registration.py", None),
+    ("pages/2_Diagnostic_Screening.py", None),
+    ("pages/3_Type_Identification.py", None),
+) + tuple((SEVERITY_PAGE, section) for section in SEVERITY_SECTIONS)
+
+# Runs in the child interpreter: argv is (page path, section or "", heavy modules as JSON)
+FIRST_RUN = """
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+
+path, section, heavy = sys.argv[1], sys.argv[2], json.loads(sys.argv[3])
+app = AppTest.from_file(path, default_timeout=300)
+if section:
+    app.session_state["navigation"] = section
+start = time.perf_counter()
+app.run()
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "ms": elapsed * 1000,
+    "loaded": [name for name in heavy if name in sys.modules],
+    "error": bool(app.exception)
+}))
+"""
+
+
+def child_env():
+    env = dict(os.environ)
+    env["CDSS_IMAGE_CACHE_OFFLINE"] = "1"
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [ROOT_DIR, env.get("PYTHONPATH")]))
+    return env
+
+
+def import_cost_ms(module):
+    """Milliseconds to import module in an interpreter that already imported streamlit"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import streamlit; import {module}"],
+        capture_output=True, text=True, check=True, cwd=ROOT_DIR
+    )
+    # "import time: self | cumulative | name"; top-level imports are not indented.
+    # Everything top-level after streamlit's own line was pulled in by module.
+    total = 0
+    after_streamlit = False
+    for line in result.stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit() or fields[2].startswith("  "):
+            continue
+        if after_streamlit:
+            total += int(fields[1])
+        elif fields[2].strip() == "streamlit":
+            after_streamlit = True
+    return total / 1000
+
+
+def first_run(path, section):
+    """{"ms", "loaded", "error"} for one first run of the page in a fresh interpreter"""
+    result = subprocess.run(
+        [sys.executable, "-c", FIRST_RUN, os.path.join(ROOT_DIR, path), section or "", json.dumps(HEAVY_MODULES)],
+        capture_output=True, text=True, check=True, cwd=ROOT_DIR, env=child_env()
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=3, help="fresh interpreters per page")
+    args = parser.parse_args()
+
+    print(f"{'module':<24}{'import ms':>10}")
+    for module in HEAVY_MODULES:
+        print(f"{module:<24}{import_cost_ms(module):>10.1f}")
+    print()
+
+    print(f"{'page':<56}{'first run ms':>13}  heavy imports")
+    for path, section in TARGETS:
+        runs = [first_run(path, section) for _ in range(args.repeat)]
+        label = f"{os.path.basename(path)} [{section}]" if section else os.path.basename(path)
+        best = min(run["ms"] for run in runs)
+        loaded = ", ".join(runs[0]["loaded"]) or "-"
+        if any(run["error"] for run in runs):
+            loaded += "  (page raised)"
+        print(f"{label:<56}{best:>13.0f}  {loaded}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark per-rerun allocations: page literals versus the shared knowledge pack
+
+    python -m benchmarks.knowledge_pack [--reruns N]
+
+Pages used to rebuild the clinical content from literals on every rerun.
+The literal side execs the same structures as Python source, compiled once
+the way Streamlit caches page bytecode; the pack side execs the lookups
+the pages now do. tracemalloc measures the bytes each rerun allocates.
+"""
+import argparse
+import json
+import time
+import tracemalloc
+
+from cdss import knowledge
+
+
+def literal_source():
+    """Python source that rebuilds every pack section from literals, like the old pages"""
+    with open(knowledge.PACK_PATH, encoding="utf-8") as f:
+        data = json.load(f)
+    return "\n".join(f"{section} = {data[section]!r}" for section in knowledge.SECTIONS)
+
+
+def pack_source():
+    """Python source that looks every section up in the loaded pack, like the pages now"""
+    return "\n".join(f"{section} = knowledge.load_pack()[{section!r}]" for section in knowledge.SECTIONS)
+
+
+def measure(code, reruns):
+    """(mean bytes allocated, mean microseconds) per exec of code"""
+    exec(code, {"knowledge": knowledge})
+
+    # Every rerun's objects are kept alive, as they would be across concurrent
+    # sessions, so CPython's dict/list free lists cannot hide the allocations
+    namespaces = []
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for _ in range(reruns):
+        namespace = {"knowledge": knowledge}
+        exec(code, namespace)
+        namespaces.append(namespace)
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del namespaces
+
+    start = time.perf_counter()
+    for _ in range(reruns):
+        exec(code, {"knowledge": knowledge})
+    elapsed = time.perf_counter() - start
+    return allocated / reruns, elapsed / reruns * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--reruns', type=int, default=1000, help="simulated page reruns")
+    args = parser.parse_args()
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    knowledge.load_pack()
+    load_ms = (time.perf_counter() - start) * 1000
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"knowledge pack {knowledge.content_version()}: loaded once in {load_ms:.2f} ms, "
+          f"{retained / 1024:.1f} KiB retained per process")
+
+    literal_bytes, literal_us = measure(compile(literal_source(), "<literals>", "exec"), args.reruns)
+    pack_bytes, pack_us = measure(compile(pack_source(), "<pack>", "exec"), args.reruns)
+
+    print(f"{'per rerun':<12} {'allocated':>12} {'time':>10}")
+    print(f"{'literals':<12} {literal_bytes / 1024:>9.1f} KiB {literal_us:>7.1f} us")
+    print(f"{'pack':<12} {pack_bytes / 1024:>9.1f} KiB {pack_us:>7.1f} us")
+    print(f"allocation reduction: {literal_bytes / max(pack_bytes, 1):.0f}x")
+
+
+if __name__ == "__main__":
+    main()
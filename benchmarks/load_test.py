@@ -0,0 +1,287 @@
+"""Load-test the pages with many simulated clinician sessions
+
+    python -m benchmarks.load_test [--sessions N] [--workers N] [--scenario NAME] [--think-time S]
+
+Each session is a Streamlit AppTest that opens a page and works through a
+scripted sequence of widget changes, one rerun per interaction:
+
+    home          open Home.py
+    registration  fill in the patient form and open the severity tool
+    screening     answer all 19 questions, one section at a time
+    types         tick two psoriasis types and open their reference galleries,
+                  then show and hide every gallery
+    severity      score PASI for every region, BSA by visual estimate and
+                  the DLQI questionnaire, then request treatment advice
+
+--sessions sessions run in each of --workers processes. AppTest keeps the
+Streamlit runtime in process-global state, so sessions cannot share a
+process across threads; within a worker they are kept open together and
+advance one interaction at a time in turn, the way a single server process
+serves its sessions' reruns one after another under the GIL. Workers run
+in parallel, like a deployment with several app processes.
+
+The report gives throughput (reruns per second across all workers), rerun
+latency percentiles per scenario, and resident memory per open session:
+the growth of each worker's RSS from a warmed-up baseline to the moment all
+its sessions are open, divided by their number. AppTest also keeps each
+session's element tree, so this overstates a real session slightly. With
+--think-time, the report estimates how many clinicians one worker can
+serve when each pauses that many seconds between interactions.
+
+Runs fully offline: reference images are served from the local cache or
+the placeholder (CDSS_IMAGE_CACHE_OFFLINE=1), the metrics exporter is off
+and perf records stay in memory.
+"""
+import argparse
+import gc
+import logging
+import multiprocessing
+import os
+import random
+import resource
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Set before the workers import cdss, which reads them at import time
+OFFLINE_ENV = {
+    "CDSS_IMAGE_CACHE_OFFLINE": "1",
+    "CDSS_METRICS_PORT": "0",
+    "CDSS_PERF_LOG": "",
+}
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+def home(app, rng):
+    yield
+
+
+def registration(app, rng):
+    yield
+    app.text_input(key="name_input").input(f"Patient {rng.randrange(10000)}")
+    yield
+    app.number_input(key="age_input").set_value(rng.randint(18, 90))
+    yield
+    app.selectbox(key="sex_input").set_value(rng.choice(["Male", "Female", "Other"]))
+    yield
+    app.text_input(key="mrn_input").input(f"MRN{rng.randrange(10 ** 6):06d}")
+    yield
+    app.button(key="btn_severity").click()
+    yield
+
+
+def screening(app, rng):
+    from cdss import screening as screening_engine
+
+    yield
+    section_count = len(screening_engine.SCREENING_SECTIONS)
+    for index, section in enumerate(screening_engine.SCREENING_SECTIONS):
+        for q in screening_engine.SCREENING_QUESTIONS:
+            if q["section"] == section["key"]:
+                app.radio(key=f"q{q['number']}").set_value(rng.choice(["No", "Yes"]))
+                yield
+        if index < section_count - 1:
+            next(button for button in app.button if button.label.startswith("Next section")).click()
+            yield
+
+
+def types(app, rng):
+    from cdss.psoriasis_types import PSORIASIS_TYPES
+
+    yield
+    for psoriasis_type in rng.sample(sorted(PSORIASIS_TYPES), 2):
+        app.checkbox(key=f"select_{psoriasis_type}").check()
+        yield
+        app.toggle(key=f"gallery_{psoriasis_type}").set_value(True)
+        yield
+    app.toggle(key="gallery_show_all").set_value(True)
+    yield
+    app.toggle(key="gallery_show_all").set_value(False)
+    yield
+
+
+def severity(app, rng):
+    from cdss import bsa as bsa_engine
+    from cdss import dlqi as dlqi_engine
+    from cdss import pasi as pasi_engine
+
+    yield
+    app.selectbox(key="navigation").set_value("PASI Scoring System")
+    yield
+    for region in pasi_engine.REGIONS:
+        for component in ("erythema", "induration", "scaling"):
+            app.selectbox(key=f"{region}_{component}").set_value(rng.randint(0, 4))
+            yield
+        app.number_input(key=f"{region}_area").set_value(rng.randint(0, 100))
+        yield
+    app.selectbox(key="navigation").set_value("BSA Assessment")
+    yield
+    for region, _ in bsa_engine.BODY_REGIONS:
+        app.slider(key=f"visual_{region}").set_value(rng.randint(0, 60))
+        yield
+    app.selectbox(key="navigation").set_value("DLQI Evaluation")
+    yield
+    for q in dlqi_engine.DLQI_QUESTIONS:
+        app.radio(key=q["key"]).set_value(rng.randrange(len(q["options"])))
+        yield
+    app.selectbox(key="navigation").set_value("Treatment Recommendations")
+    yield
+    next(button for button in app.button if button.label == "Generate Treatment Recommendations").click()
+    yield
+
+
+SCENARIOS = {
+    "home": ("Home.py", home),
+    "registration": ("pages/1_Patient_Registration.py", registration),
+    "screening": ("pages/2_Diagnostic_Screening.py", screening),
+    "types": ("pages/3_Type_Identification.py", types),
+    "severity": ("pages/4_Severity_Assessment.py", severity),
+}
+
+
+def rss_bytes():
+    """Current resident set size; peak RSS where /proc is not available"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def open_session(name, seed):
+    from streamlit.testing.v1 import AppTest
+
+    path, script = SCENARIOS[name]
+    app = AppTest.from_file(os.path.join(ROOT_DIR, path), default_timeout=120)
+    return {"scenario": name, "app": app, "steps": script(app, random.Random(seed)), "reruns": 0, "errors": 0}
+
+
+def step(session, latencies):
+    """Apply the session's next interaction and rerun; False once its script is done"""
+    try:
+        next(session["steps"])
+    except StopIteration:
+        return False
+    start = time.perf_counter()
+    session["app"].run()
+    latencies.append(time.perf_counter() - start)
+    session["reruns"] += 1
+    if session["app"].exception:
+        session["errors"] += 1
+    return True
+
+
+def run_worker(args):
+    """Run one worker's sessions interleaved; returns its latencies, counts and memory"""
+    worker, scenarios, sessions, seed = args
+    # Streamlit's deprecation warnings would repeat on every rerun of every session
+    logging.disable(logging.WARNING)
+    # Import the pages and engines and fill the module caches outside the measurement
+    for name in dict.fromkeys(scenarios):
+        session = open_session(name, seed)
+        while step(session, []):
+            pass
+    del session
+    gc.collect()
+    baseline = rss_bytes()
+
+    open_sessions = [
+        open_session(scenarios[i % len(scenarios)], seed + worker * sessions + i)
+        for i in range(sessions)
+    ]
+    latencies = {name: [] for name in scenarios}
+    active = list(open_sessions)
+    start = time.perf_counter()
+    while active:
+        active = [session for session in active if step(session, latencies[session["scenario"]])]
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    return {
+        "elapsed": elapsed,
+        "latencies": latencies,
+        "reruns": sum(session["reruns"] for session in open_sessions),
+        "errors": sum(session["errors"] for session in open_sessions),
+        "memory": rss_bytes() - baseline,
+        "sessions": len(open_sessions),
+    }
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-p * len(sorted_values) // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sessions', type=int, default=20, help="sessions per worker")
+    parser.add_argument('--workers', type=int, default=1, help="worker processes")
+    parser.add_argument('--scenario', choices=["all"] + list(SCENARIOS), default="all")
+    parser.add_argument('--think-time', type=float, default=0.0,
+                        help="seconds a clinician pauses between interactions, for the capacity estimate")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    os.environ.update(OFFLINE_ENV)
+    os.environ["PYTHONPATH"] = os.pathsep.join(filter(None, [ROOT_DIR, os.environ.get("PYTHONPATH")]))
+    os.chdir(ROOT_DIR)
+
+    scenarios = list(SCENARIOS) if args.scenario == "all" else [args.scenario]
+    if args.sessions < len(scenarios):
+        parser.error(f"--sessions must be at least {len(scenarios)} to run every scenario in each worker")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    jobs = [(worker, scenarios, args.sessions, args.seed) for worker in range(args.workers)]
+    start = time.perf_counter()
+    with multiprocessing.get_context("spawn").Pool(args.workers) as pool:
+        results = pool.map(run_worker, jobs)
+    wall = time.perf_counter() - start
+
+    reruns = sum(result["reruns"] for result in results)
+    errors = sum(result["errors"] for result in results)
+    busy = max(result["elapsed"] for result in results)
+    sessions = sum(result["sessions"] for result in results)
+    print(f"{sessions} sessions in {args.workers} worker(s), {reruns} reruns, {errors} with exceptions "
+          f"({wall:.1f} s including startup)")
+    print(f"throughput: {reruns / busy:.1f} reruns/s, {sessions / busy:.2f} sessions/s")
+    print()
+
+    header = "".join(f"{f'p{p} ms':>10}" for p in PERCENTILES)
+    print(f"{'scenario':<14}{'reruns':>8}{'mean ms':>10}{header}")
+    combined = []
+    for name in scenarios + ["all"]:
+        if name == "all":
+            if len(scenarios) == 1:
+                break
+            values = sorted(combined)
+        else:
+            values = sorted(value for result in results for value in result["latencies"][name])
+            combined.extend(values)
+        row = "".join(f"{percentile(values, p) * 1000:>10.1f}" for p in PERCENTILES)
+        mean = sum(values) / len(values) * 1000 if values else 0.0
+        print(f"{name:<14}{len(values):>8}{mean:>10.1f}{row}")
+    print()
+
+    # RSS can shrink when the allocator returns warm-up memory; a non-positive
+    # growth means the sessions' memory is below what RSS can resolve
+    per_session = [result["memory"] / result["sessions"] for result in results]
+    if max(per_session) <= 0:
+        print("memory per open session: below RSS measurement noise (RSS did not grow); "
+              "rerun with more --sessions")
+    else:
+        mean = sum(max(value, 0) for value in per_session) / len(per_session)
+        print(f"memory per open session: {mean / 1024 / 1024:.2f} MB "
+              f"(max over workers {max(per_session) / 1024 / 1024:.2f} MB)")
+    if args.think_time > 0:
+        per_worker = reruns / busy / args.workers
+        print(f"one worker at {args.think_time:g} s think time: about {per_worker * args.think_time:.0f} "
+              f"concurrent clinicians before reruns start to queue")
+
+
+if __name__ == '__main__':
+    main()
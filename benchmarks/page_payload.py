@@ -0,0 +1,43 @@
+"""Measure what a page script costs to parse and how much inline image data it carries
+
+    python -m benchmarks.page_payload pages/4_Severity_Assessment.py
+    python -m benchmarks.page_payload baseline:pages/4_Severity_Assessment.py
+
+A REV:PATH argument reads the file from git, for before/after comparisons.
+Inline data: URIs are sent to the browser inside the element delta on
+every rerun that renders them; static URLs are fetched once and cached.
+"""
+import argparse
+import re
+import subprocess
+import timeit
+
+DATA_URI = re.compile(r'data:image/[a-z+]+;base64,[A-Za-z0-9+/=]+')
+
+
+def read_source(spec):
+    """Read a working-tree path or a git REV:PATH"""
+    if ':' in spec:
+        return subprocess.run(['git', 'show', spec], check=True, capture_output=True, text=True).stdout
+    with open(spec, encoding='utf-8') as f:
+        return f.read()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('sources', nargs='+', help="page path or git REV:PATH")
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'source':<48}{'bytes':>10}{'inline img':>12}{'compile ms':>12}")
+    for spec in args.sources:
+        source = read_source(spec)
+        inline_bytes = sum(len(m.group(0)) for m in DATA_URI.finditer(source))
+        compile_seconds = min(timeit.repeat(
+            lambda: compile(source, spec, 'exec'), number=1, repeat=args.repeat
+        ))
+        print(f"{spec:<48}{len(source.encode()):>10}{inline_bytes:>12}{compile_seconds * 1e3:>12.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,295 @@
+"""Benchmark the scoring engines and gate releases on their throughput
+
+    python -m benchmarks.scoring run [--sizes 1,1000,1000000] [--save PATH]
+    python -m benchmarks.scoring compare [--baseline PATH] [--threshold 0.15]
+
+Every case scores N synthetic patients at each size, either the way the
+pages do (scalar: one engine call per patient) or in one batched call:
+
+    area_score       convert_area_to_score: pasi.area_score / pasi.area_to_score
+    pasi_total       build_pasi_scores + calculate_total_pasi: pasi.score_pasi
+    bsa              the BSA visual estimate and palm method: bsa.score_bsa
+    dlqi             the DLQI questionnaire loop: dlqi.score_dlqi
+    screening        diagnostic matrix sums: screening.score_answers, and
+                     screening.score_masks on packed answers (batch only)
+    treatment        generate_treatment_recommendations + render_recommendations:
+                     treatment.classify_patient / treatment.classify_arrays
+
+Results are patients per second, best of --repeat timings. "run" prints
+them and with --save writes them as JSON. "compare" runs the suite at the
+baseline's sizes and exits 1 when any case's throughput falls more than
+--threshold below the baseline, after re-measuring such a case up to
+CONFIRM_RETRIES times to rule out a momentary stall. The committed baseline
+(benchmarks/baselines/scoring.json) was recorded on one machine; record a
+new one with run --save on the machine that runs the gate.
+"""
+import argparse
+import json
+import os
+import platform
+import time
+import timeit
+
+import numpy as np
+
+from cdss import bsa, dlqi, pasi, screening, treatment
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "scoring.json")
+
+DEFAULT_SIZES = (1, 1_000, 1_000_000)
+
+# Timings after the first stop once a case has used this many seconds
+MAX_CASE_SECONDS = 5.0
+
+# Times compare re-measures a case that looks regressed before failing it
+CONFIRM_RETRIES = 2
+
+
+def pasi_assessments(rng, n):
+    assessments = rng.integers(0, 5, (n, len(pasi.REGIONS), len(pasi.COMPONENTS)))
+    assessments[:, :, pasi.AREA] = rng.integers(0, 101, (n, len(pasi.REGIONS)))
+    return assessments
+
+
+def dlqi_answers(rng, n):
+    # A tenth of the answers left blank, as the page allows
+    answers = rng.integers(0, 4, (n, len(dlqi.DLQI_QUESTIONS)))
+    answers[rng.random(answers.shape) < 0.1] = dlqi.UNANSWERED
+    return answers
+
+
+def treatment_inputs(rng, n):
+    return (
+        rng.uniform(0, 40, n).round(1),
+        rng.uniform(0, 60, n).round(1),
+        rng.integers(0, 31, n),
+        rng.integers(1, 101, n),
+        rng.integers(0, 51, n),
+    )
+
+
+def area_score_scalar(rng, n):
+    percentages = rng.integers(0, 101, n).tolist()
+    return lambda: [pasi.area_score(p) for p in percentages]
+
+
+def area_score_batch(rng, n):
+    percentages = rng.integers(0, 101, n)
+    return lambda: pasi.area_to_score(percentages)
+
+
+def pasi_total_scalar(rng, n):
+    patients = pasi_assessments(rng, n).tolist()
+
+    def score():
+        for assessment in patients:
+            float(pasi.score_pasi(assessment)['total_pasi'][0])
+    return score
+
+
+def pasi_total_batch(rng, n):
+    assessments = pasi_assessments(rng, n)
+    return lambda: pasi.score_pasi(assessments)['total_pasi']
+
+
+def bsa_scalar(rng, n):
+    affected = rng.integers(0, 101, (n, len(bsa.BODY_REGIONS))).tolist()
+    palms = rng.integers(0, 21, n).tolist()
+
+    def score():
+        for row, palm_count in zip(affected, palms):
+            float(bsa.score_bsa([row], [palm_count])['final'][0])
+    return score
+
+
+def bsa_batch(rng, n):
+    affected = rng.integers(0, 101, (n, len(bsa.BODY_REGIONS)))
+    palms = rng.integers(0, 21, n)
+    return lambda: bsa.score_bsa(affected, palms)['final']
+
+
+def dlqi_scalar(rng, n):
+    patients = dlqi_answers(rng, n).tolist()
+
+    def score():
+        for answers in patients:
+            int(dlqi.score_dlqi([answers])['total'][0])
+    return score
+
+
+def dlqi_batch(rng, n):
+    answers = dlqi_answers(rng, n)
+    return lambda: dlqi.score_dlqi(answers)['total']
+
+
+def screening_scalar(rng, n):
+    patients = (rng.random((n, screening.NUM_QUESTIONS)) < 0.5).tolist()
+
+    def score():
+        for answers in patients:
+            {name: int(value) for name, value in screening.score_answers(answers).items()}
+    return score
+
+
+def screening_batch(rng, n):
+    answers = rng.random((n, screening.NUM_QUESTIONS)) < 0.5
+    return lambda: screening.score_answers(answers)['total_score']
+
+
+def screening_masks_batch(rng, n):
+    masks = screening.pack_answers(rng.random((n, screening.NUM_QUESTIONS)) < 0.5)
+    screening.score_table()
+    return lambda: screening.score_masks(masks)['total_score']
+
+
+def treatment_scalar(rng, n):
+    patients = list(zip(*(column.tolist() for column in treatment_inputs(rng, n))))
+
+    def score():
+        for pasi_score, bsa_score, dlqi_score, age, duration in patients:
+            categories = treatment.classify_patient(pasi_score, bsa_score, dlqi_score, age, duration)
+            treatment.render_recommendations(dict(categories, age=age))
+    return score
+
+
+def treatment_batch(rng, n):
+    columns = treatment_inputs(rng, n)
+    return lambda: treatment.classify_arrays(*columns)['severity']
+
+
+# (case, path, setup); setup(rng, n) returns a callable that scores n patients
+CASES = (
+    ("area_score", "scalar", area_score_scalar),
+    ("area_score", "batch", area_score_batch),
+    ("pasi_total", "scalar", pasi_total_scalar),
+    ("pasi_total", "batch", pasi_total_batch),
+    ("bsa", "scalar", bsa_scalar),
+    ("bsa", "batch", bsa_batch),
+    ("dlqi", "scalar", dlqi_scalar),
+    ("dlqi", "batch", dlqi_batch),
+    ("screening", "scalar", screening_scalar),
+    ("screening", "batch", screening_batch),
+    ("screening_masks", "batch", screening_masks_batch),
+    ("treatment", "scalar", treatment_scalar),
+    ("treatment", "batch", treatment_batch),
+)
+
+
+def patients_per_second(func, n, repeat):
+    """Best throughput over up to repeat timings of func (each run scoring n patients)"""
+    timer = timeit.Timer(func)
+    number, elapsed = timer.autorange()
+    best = elapsed / number
+    spent = elapsed
+    for _ in range(repeat - 1):
+        if spent >= MAX_CASE_SECONDS:
+            break
+        elapsed = timer.timeit(number)
+        best = min(best, elapsed / number)
+        spent += elapsed
+    return n / best
+
+
+def measure(setup, n, repeat):
+    func = setup(np.random.default_rng(0), n)
+    func()  # warm up caches and lazy tables outside the timing
+    return patients_per_second(func, n, repeat)
+
+
+def run_suite(sizes, repeat, report=print):
+    """{"case/path/size": patients per second} for every case at every size"""
+    results = {}
+    report(f"{'case':<18}{'path':<8}{'patients':>10}{'patients/s':>16}")
+    for name, path, setup in CASES:
+        for n in sizes:
+            throughput = measure(setup, n, repeat)
+            results[f"{name}/{path}/{n}"] = throughput
+            report(f"{name:<18}{path:<8}{n:>10}{throughput:>16,.0f}")
+    return results
+
+
+def confirm_regressions(baseline, current, threshold, repeat):
+    """Re-measure cases that look slower than threshold allows, keeping their best result
+
+    A one-off stall on a shared machine clears on the retry; a real
+    regression does not.
+    """
+    setups = {f"{name}/{path}": setup for name, path, setup in CASES}
+    for key, before in baseline.items():
+        for _ in range(CONFIRM_RETRIES):
+            if key not in current or current[key] >= before * (1 - threshold):
+                break
+            case, n = key.rsplit("/", 1)
+            current[key] = max(current[key], measure(setups[case], int(n), repeat))
+
+
+def environment():
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor() or platform.machine(),
+        "recorded": time.strftime("%Y-%m-%d"),
+    }
+
+
+def compare(baseline, current, threshold):
+    """Print each case against the baseline; returns the keys that regressed past threshold"""
+    regressed = []
+    print(f"{'case':<36}{'baseline/s':>16}{'current/s':>16}{'change':>9}")
+    for key, before in baseline.items():
+        if key not in current:
+            print(f"{key:<36}{before:>16,.0f}{'missing':>16}")
+            continue
+        change = current[key] / before - 1
+        flag = ""
+        if change < -threshold:
+            regressed.append(key)
+            flag = "  REGRESSED"
+        print(f"{key:<36}{before:>16,.0f}{current[key]:>16,.0f}{change:>+9.1%}{flag}")
+    return regressed
+
+
+def parse_sizes(text):
+    return tuple(int(size) for size in text.split(","))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_cmd = commands.add_parser("run", help="benchmark every case and size")
+    run_cmd.add_argument("--sizes", type=parse_sizes, default=DEFAULT_SIZES, help="comma-separated patient counts")
+    run_cmd.add_argument("--repeat", type=int, default=5)
+    run_cmd.add_argument("--save", metavar="PATH", nargs="?", const=BASELINE_PATH,
+                         help=f"write the results as a baseline (default {os.path.relpath(BASELINE_PATH)})")
+    compare_cmd = commands.add_parser("compare", help="rerun the suite and fail on regressions against a baseline")
+    compare_cmd.add_argument("--baseline", default=BASELINE_PATH)
+    compare_cmd.add_argument("--threshold", type=float, default=0.15, help="allowed throughput drop (0.15 = 15%%)")
+    compare_cmd.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.command == "run":
+        results = run_suite(args.sizes, args.repeat)
+        if args.save:
+            os.makedirs(os.path.dirname(args.save), exist_ok=True)
+            with open(args.save, "w", encoding="utf-8") as f:
+                json.dump({"environment": environment(), "sizes": list(args.sizes), "results": results},
+                          f, indent=2)
+                f.write("\n")
+            print(f"\nSaved {len(results)} results to {args.save}")
+    elif args.command == "compare":
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(f"Baseline recorded {baseline['environment']['recorded']} "
+              f"(Python {baseline['environment']['python']}, NumPy {baseline['environment']['numpy']})\n")
+        current = run_suite(baseline["sizes"], args.repeat, report=lambda line: None)
+        confirm_regressions(baseline["results"], current, args.threshold, args.repeat)
+        regressed = compare(baseline["results"], current, args.threshold)
+        if regressed:
+            print(f"\n{len(regressed)} case(s) slower than the baseline by more than {args.threshold:.0%}")
+            raise SystemExit(1)
+        print(f"\nNo case slower than the baseline by more than {args.threshold:.0%}")
+
+
+if __name__ == '__main__':
+    main()
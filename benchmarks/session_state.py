@@ -0,0 +1,153 @@
+"""Measure per-session memory and serialization of the assessment record
+
+    python -m benchmarks.session_state [--sessions N]
+
+Builds N filled-in sessions two ways: the loose session-state values the
+pages used to keep (patient_info dict, nested pasi_scores dicts, lists and
+the DLQI result dict) and one cdss.assessment.Assessment each. Memory is
+the tracemalloc growth per session; serialization is best-of timings for
+pickle of the loose values, Assessment.to_bytes/from_bytes and pickle of
+the record.
+"""
+import argparse
+import pickle
+import random
+import timeit
+import tracemalloc
+from datetime import date
+
+from cdss import bsa, dlqi, pasi, screening
+from cdss.assessment import Assessment
+from cdss.psoriasis_types import PSORIASIS_TYPES
+
+
+def filled_assessment(rng):
+    """A record with every section entered, as after a full visit"""
+    record = Assessment()
+    record.patient_name = f"Patient {rng.randrange(10 ** 6)}"
+    record.patient_age = rng.randint(18, 90)
+    record.patient_sex = rng.choice(["Male", "Female", "Other"])
+    record.patient_mrn = f"MRN{rng.randrange(10 ** 6):06d}"
+    record.assessment_date = date.today()
+    record.disease_duration = rng.randint(0, 40)
+    for region_index in range(len(pasi.REGIONS)):
+        record.set_pasi_row(region_index, [rng.randint(0, 4) for _ in range(3)] + [rng.randint(0, 100)])
+    record.pasi_total = float(pasi.score_pasi(record.pasi_rows())['total_pasi'][0])
+    record.set_bsa_affected([rng.randint(0, 60) for _ in bsa.BODY_REGIONS])
+    record.bsa_score = float(bsa.score_bsa([record.bsa_affected])['final'][0])
+    record.set_dlqi_answers([rng.randrange(len(q['options'])) for q in dlqi.DLQI_QUESTIONS])
+    record.dlqi_score = int(dlqi.score_dlqi([record.dlqi])['total'][0])
+    for q in screening.SCREENING_QUESTIONS:
+        record.set_screening_answer(q['number'], rng.random() < 0.5)
+    record.identified_types = tuple(rng.sample(sorted(PSORIASIS_TYPES), 2))
+    return record
+
+
+def loose_session_state(record):
+    """The same session as the separate session-state values the pages kept before the record"""
+    rows = record.pasi_rows()
+    result = pasi.score_pasi(rows)
+    pasi_scores = {}
+    for i, region_key in enumerate(pasi.REGIONS):
+        erythema, induration, scaling, area_percentage = rows[i]
+        pasi_scores[region_key] = {
+            'name': pasi.REGION_NAMES[i],
+            'erythema': erythema,
+            'induration': induration,
+            'scaling': scaling,
+            'area_percentage': area_percentage,
+            'area_score': int(result['area_score'][0, i]),
+            'severity_sum': erythema + induration + scaling,
+            'regional_pasi': float(result['regional_pasi'][0, i]),
+            'weight': float(pasi.REGION_WEIGHTS[i])
+        }
+    dlqi_result = dlqi.score_dlqi([record.dlqi])
+    return {
+        'patient_info': {
+            'patient_name': record.patient_name,
+            'patient_age': record.patient_age,
+            'patient_sex': record.patient_sex,
+            'patient_mrn': record.patient_mrn,
+            'assessment_date': record.assessment_date,
+            'patient_contact': record.patient_contact,
+            'patient_email': record.patient_email,
+        },
+        'patient_age': record.patient_age,
+        'disease_duration': record.disease_duration,
+        'pasi_scores': pasi_scores,
+        'pasi_assessment': rows,
+        'bsa_affected': record.bsa_affected.tolist(),
+        'bsa_score': record.bsa_score,
+        'dlqi_score': record.dlqi_score,
+        'dlqi_result': {
+            'total': int(dlqi_result['total'][0]),
+            'answered': int(dlqi_result['answered'][0]),
+            'domain_totals': {
+                domain: int(dlqi_result['domain_scores'][0, j])
+                for j, domain in enumerate(dlqi_result['domains'])
+                if dlqi_result['domain_answered'][0, j]
+            }
+        },
+        'screening_answers': {q['number']: record.screening_answer(q['number']) for q in screening.SCREENING_QUESTIONS},
+        'identified_types': list(record.identified_types),
+    }
+
+
+def bytes_per_session(build, sources):
+    """tracemalloc growth per object while holding build(source) for every source"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    held = [build(source) for source in sources]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del held
+    return (after - before) / len(sources)
+
+
+def best_us(stmt, repeat=7, number=2000):
+    return min(timeit.repeat(stmt, number=number, repeat=repeat)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sessions', type=int, default=10_000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    records = [filled_assessment(rng) for _ in range(args.sessions)]
+
+    # Copy the records so both layouts are measured from scratch
+    loose = bytes_per_session(loose_session_state, records)
+    compact = bytes_per_session(lambda record: Assessment.from_bytes(record.to_bytes()), records)
+    print(f"{'layout':<28}{'bytes/session':>14}")
+    print(f"{'loose session_state values':<28}{loose:>14,.0f}")
+    print(f"{'Assessment record':<28}{compact:>14,.0f}")
+    print(f"{args.sessions} sessions: {loose * args.sessions / 2 ** 20:.1f} MB -> "
+          f"{compact * args.sessions / 2 ** 20:.1f} MB ({loose / compact:.1f}x smaller)")
+    print()
+
+    record = records[0]
+    state = loose_session_state(record)
+    pickled_state = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+    encoded = record.to_bytes()
+    pickled_record = pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL)
+    assert Assessment.from_bytes(encoded) == record == pickle.loads(pickled_record)
+
+    rows = [
+        ("pickle loose values", len(pickled_state),
+         best_us(lambda: pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)),
+         best_us(lambda: pickle.loads(pickled_state))),
+        ("Assessment.to/from_bytes", len(encoded),
+         best_us(record.to_bytes),
+         best_us(lambda: Assessment.from_bytes(encoded))),
+        ("pickle Assessment", len(pickled_record),
+         best_us(lambda: pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL)),
+         best_us(lambda: pickle.loads(pickled_record))),
+    ]
+    print(f"{'serialization':<28}{'bytes':>8}{'dump us':>10}{'load us':>10}")
+    for name, size, dump, load in rows:
+        print(f"{name:<28}{size:>8}{dump:>10.2f}{load:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1 @@
+"""UI-free clinical scoring engines shared by the Streamlit pages and batch jobs"""
@@ -0,0 +1,182 @@
+"""One compact record per session for everything the clinician has entered
+
+Every page reads and writes the session's Assessment (session_assessment())
+instead of keeping its own loose session-state values. The record stores
+inputs, not derived results: pages rebuild the PASI breakdown, the DLQI
+domain scores and the screening matrix from the engines when they draw
+them, which costs microseconds, so a session keeps one small object
+instead of nested dicts per region and per question.
+
+    patient_*, assessment_date  registration form (patient_age is also the
+                                severity page's age)
+    disease_duration            years, for treatment recommendations
+    pasi                        array('B') of 16: (erythema, induration,
+                                scaling, area %) per region in pasi.REGIONS order
+    pasi_total                  total of the last scored PASI, None until scored
+    bsa_affected, bsa_score     array('B') of involvement % per bsa.BODY_REGIONS
+                                region, and the final BSA %
+    dlqi, dlqi_score            array('b') of the last scored option index per
+                                question (dlqi.UNANSWERED when blank), and the
+                                last total with at least one answer
+    screening_mask              19-bit int, bit n-1 set when question n is "Yes"
+    identified_types            tuple of psoriasis type names
+
+to_bytes() and Assessment.from_bytes() are a versioned struct encoding of
+the whole record, around a hundred bytes, for copying sessions out of process;
+pickling uses the same path.
+"""
+import struct
+from array import array
+from datetime import date
+
+import streamlit as st
+
+from cdss import bsa, dlqi, pasi, screening
+
+SESSION_KEY = "assessment"
+
+FORMAT_VERSION = 1
+
+# version, age, duration, date ordinal, screening mask, PASI total, BSA score,
+# DLQI score, PASI inputs, BSA inputs, DLQI answer count, identified type count;
+# then the DLQI answers and length-prefixed UTF-8 strings
+_HEADER = struct.Struct(f"<BHHII2dB{len(pasi.REGIONS) * len(pasi.COMPONENTS)}s{len(bsa.BODY_REGIONS)}sBB")
+_LENGTH = struct.Struct("<H")
+
+_TEXT_FIELDS = ("patient_name", "patient_sex", "patient_mrn", "patient_contact", "patient_email")
+
+
+class Assessment:
+    """Inputs and scores of one patient assessment; fields are listed in the module docstring"""
+
+    __slots__ = (
+        "patient_name", "patient_age", "patient_sex", "patient_mrn", "assessment_date",
+        "patient_contact", "patient_email", "disease_duration",
+        "pasi", "pasi_total", "bsa_affected", "bsa_score", "dlqi", "dlqi_score",
+        "screening_mask", "identified_types",
+    )
+
+    def __init__(self):
+        self.patient_name = ""
+        self.patient_age = 30
+        self.patient_sex = ""
+        self.patient_mrn = ""
+        self.assessment_date = None
+        self.patient_contact = ""
+        self.patient_email = ""
+        self.disease_duration = 5
+        self.pasi = array("B", bytes(len(pasi.REGIONS) * len(pasi.COMPONENTS)))
+        self.pasi_total = None
+        self.bsa_affected = array("B", bytes(len(bsa.BODY_REGIONS)))
+        self.bsa_score = 0.0
+        self.dlqi = array("b", [dlqi.UNANSWERED] * len(dlqi.DLQI_QUESTIONS))
+        self.dlqi_score = 0
+        self.screening_mask = 0
+        self.identified_types = ()
+
+    def pasi_rows(self):
+        """PASI inputs as one [erythema, induration, scaling, area %] list per region"""
+        width = len(pasi.COMPONENTS)
+        return [self.pasi[i:i + width].tolist() for i in range(0, len(self.pasi), width)]
+
+    def set_pasi_row(self, region_index, row):
+        width = len(pasi.COMPONENTS)
+        self.pasi[region_index * width:(region_index + 1) * width] = array("B", row)
+
+    def set_bsa_affected(self, affected):
+        self.bsa_affected = array("B", affected)
+
+    def dlqi_answers(self):
+        """Last scored DLQI answers; blank again if a knowledge pack update changed the question count"""
+        if len(self.dlqi) != len(dlqi.DLQI_QUESTIONS):
+            self.dlqi = array("b", [dlqi.UNANSWERED] * len(dlqi.DLQI_QUESTIONS))
+        return self.dlqi
+
+    def set_dlqi_answers(self, answers):
+        self.dlqi = array("b", answers)
+
+    def screening_answer(self, number):
+        return bool(self.screening_mask >> (number - 1) & 1)
+
+    def set_screening_answer(self, number, value):
+        bit = 1 << (number - 1)
+        self.screening_mask = self.screening_mask | bit if value else self.screening_mask & ~bit
+
+    def screening_answers(self):
+        """Yes/no answers in screening.SCREENING_QUESTIONS order"""
+        return [self.screening_answer(q["number"]) for q in screening.SCREENING_QUESTIONS]
+
+    def patient_ready(self):
+        """True once the registration form's required fields are filled in"""
+        return self.patient_name.strip() != "" and self.patient_age > 0 and self.patient_sex not in ("", "Select")
+
+    def to_bytes(self):
+        parts = [_HEADER.pack(
+            FORMAT_VERSION,
+            self.patient_age,
+            self.disease_duration,
+            self.assessment_date.toordinal() if self.assessment_date else 0,
+            self.screening_mask,
+            float("nan") if self.pasi_total is None else self.pasi_total,
+            self.bsa_score,
+            self.dlqi_score,
+            self.pasi.tobytes(),
+            self.bsa_affected.tobytes(),
+            len(self.dlqi),
+            len(self.identified_types),
+        ), self.dlqi.tobytes()]
+        for text in [getattr(self, name) for name in _TEXT_FIELDS] + list(self.identified_types):
+            encoded = text.encode("utf-8")
+            parts.append(_LENGTH.pack(len(encoded)))
+            parts.append(encoded)
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        (version, age, duration, ordinal, mask, pasi_total, bsa_score, dlqi_score,
+         pasi_inputs, bsa_inputs, dlqi_count, type_count) = _HEADER.unpack_from(data)
+        if version != FORMAT_VERSION:
+            raise ValueError(f"unsupported assessment format {version}")
+        record = cls.__new__(cls)
+        record.patient_age = age
+        record.disease_duration = duration
+        record.assessment_date = date.fromordinal(ordinal) if ordinal else None
+        record.screening_mask = mask
+        record.pasi_total = None if pasi_total != pasi_total else pasi_total
+        record.bsa_score = bsa_score
+        record.dlqi_score = dlqi_score
+        record.pasi = array("B", pasi_inputs)
+        record.bsa_affected = array("B", bsa_inputs)
+        offset = _HEADER.size
+        record.dlqi = array("b", data[offset:offset + dlqi_count])
+        offset += dlqi_count
+
+        texts = []
+        for _ in range(len(_TEXT_FIELDS) + type_count):
+            (length,) = _LENGTH.unpack_from(data, offset)
+            offset += _LENGTH.size
+            texts.append(data[offset:offset + length].decode("utf-8"))
+            offset += length
+        for name, text in zip(_TEXT_FIELDS, texts):
+            setattr(record, name, text)
+        record.identified_types = tuple(texts[len(_TEXT_FIELDS):])
+        return record
+
+    def __reduce__(self):
+        return Assessment.from_bytes, (self.to_bytes(),)
+
+    def __eq__(self, other):
+        if not isinstance(other, Assessment):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    # Mutable and compared by value, so deliberately unhashable
+    __hash__ = None
+
+
+def session_assessment():
+    """This session's Assessment, created on first use; shared by every page"""
+    record = st.session_state.get(SESSION_KEY)
+    if record is None:
+        record = st.session_state[SESSION_KEY] = Assessment()
+    return record
@@ -0,0 +1,132 @@
+"""Content-hashed static assets served by Streamlit's static file endpoint
+
+Files live under static/ (server.enableStaticServing in .streamlit/config.toml)
+with the first 12 hex digits of their SHA-256 in the filename, so a URL
+never changes meaning and browsers and proxies can cache it indefinitely.
+static/manifest.json maps stable asset names to the current hashed file.
+Pages pass images to st.image through image_source(), which falls back to
+the file path on Streamlit releases that cannot take a static URL.
+
+Publish or update an asset with:
+
+    python -m cdss.assets publish path/to/image.jpg --name pasi-guide.jpg
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+from functools import lru_cache
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STATIC_DIR = os.path.join(ROOT_DIR, "static")
+MANIFEST_PATH = os.path.join(STATIC_DIR, "manifest.json")
+
+# Streamlit serves STATIC_DIR at this URL prefix
+STATIC_URL_PREFIX = "/app/static/"
+
+HASH_LENGTH = 12
+
+# First Streamlit release whose st.image passes /app/static/ URLs through;
+# older releases try to open them as files and fail
+IMAGE_URL_MIN_VERSION = (1, 56)
+
+
+@lru_cache(maxsize=1)
+def load_manifest():
+    """Asset name -> hashed path relative to STATIC_DIR, read once per process"""
+    try:
+        with open(MANIFEST_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def static_url(name):
+    """Browser URL of a published asset"""
+    return STATIC_URL_PREFIX + load_manifest()[name]
+
+
+def static_path(name):
+    """Filesystem path of a published asset"""
+    return os.path.join(STATIC_DIR, load_manifest()[name])
+
+
+@lru_cache(maxsize=1)
+def streamlit_version():
+    import streamlit
+
+    return tuple(int(part) for part in re.findall(r"\d+", streamlit.__version__)[:2])
+
+
+def image_source(name):
+    """Source to pass to st.image for a published image: its static URL, or its file on older Streamlit"""
+    if streamlit_version() >= IMAGE_URL_MIN_VERSION:
+        return static_url(name)
+    return static_path(name)
+
+
+def hashed_filename(name, data):
+    """Insert the content hash of data before the extension of name"""
+    stem, ext = os.path.splitext(name)
+    digest = hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+    return f"{stem}.{digest}{ext}"
+
+
+def publish(data, name, subdir="images"):
+    """Write data under its content-hashed name and record it in the manifest
+
+    Returns the hashed path relative to STATIC_DIR. A previous version of
+    the same asset is removed once the manifest points at the new file.
+    """
+    relative_path = f"{subdir}/{hashed_filename(name, data)}"
+    target = os.path.join(STATIC_DIR, relative_path)
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    with open(target, "wb") as f:
+        f.write(data)
+
+    manifest = dict(load_manifest())
+    previous = manifest.get(name)
+    manifest[name] = relative_path
+    _write_manifest(manifest)
+
+    if previous and previous != relative_path:
+        try:
+            os.remove(os.path.join(STATIC_DIR, previous))
+        except FileNotFoundError:
+            pass
+    return relative_path
+
+
+def _write_manifest(manifest):
+    """Atomically replace the manifest and drop the cached copy"""
+    tmp_path = MANIFEST_PATH + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(dict(sorted(manifest.items())), f, indent=2)
+        f.write("\n")
+    os.replace(tmp_path, MANIFEST_PATH)
+    load_manifest.cache_clear()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage content-hashed static assets")
+    commands = parser.add_subparsers(dest="command", required=True)
+    publish_cmd = commands.add_parser("publish", help="add or update an asset")
+    publish_cmd.add_argument("source", help="file to publish")
+    publish_cmd.add_argument("--name", help="stable asset name (default: source filename)")
+    publish_cmd.add_argument("--subdir", default="images", help="directory under static/")
+    commands.add_parser("list", help="show the manifest")
+    args = parser.parse_args()
+
+    if args.command == "publish":
+        with open(args.source, "rb") as f:
+            data = f.read()
+        name = args.name or os.path.basename(args.source)
+        print(f"{name} -> {STATIC_URL_PREFIX}{publish(data, name, args.subdir)}")
+    else:
+        for name, path in load_manifest().items():
+            print(f"{name} -> {STATIC_URL_PREFIX}{path}")
+
+
+if __name__ == "__main__":
+    main()
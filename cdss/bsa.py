@@ -0,0 +1,60 @@
+"""Rule-of-nines BSA (Body Surface Area) engine
+
+Visual estimates are arrays shaped (N, 8): the percentage of each body
+region in BODY_REGIONS order that is affected, 0-100.
+"""
+import numpy as np
+
+# Body regions with their share of total body surface area (%)
+BODY_REGIONS = (
+    ("Head & Neck", 9),
+    ("Both Arms", 18),
+    ("Chest", 9),
+    ("Abdomen", 9),
+    ("Upper Back", 9),
+    ("Lower Back", 9),
+    ("Both Legs", 36),
+    ("Genitals", 1)
+)
+REGION_NAMES = tuple(name for name, _ in BODY_REGIONS)
+REGION_PROPORTIONS = np.array([proportion for _, proportion in BODY_REGIONS], dtype=np.float64)
+
+# Calls and rows scored since the process started, read by cdss.metrics
+stats = {"calls": 0, "rows": 0}
+
+
+def region_contributions(affected, proportions=REGION_PROPORTIONS):
+    """BSA % contributed by each region, from involvement percentages shaped (N, 8)"""
+    affected = np.asarray(affected, dtype=np.float64)
+    if affected.ndim == 1:
+        affected = affected[np.newaxis]
+    if affected.shape[1:] != proportions.shape:
+        raise ValueError(f"expected affected shaped (N, {len(proportions)}), got {affected.shape}")
+    return (affected / 100) * proportions
+
+
+def visual_bsa(contributions):
+    """Total visual-estimate BSA % from regional contributions shaped (N, 8)"""
+    # Accumulate regions left to right so totals match the page exactly
+    total = np.zeros(len(contributions))
+    for column in contributions.T:
+        total += column
+    return total
+
+
+def score_bsa(affected, palm_counts=None, proportions=REGION_PROPORTIONS):
+    """Score a batch of BSA assessments
+
+    The final BSA is the larger of the visual estimate and the palm-method
+    count (1 palm = 1% BSA), as on the BSA page. Returns a dict of
+    arrays: 'contributions' (N, 8), 'visual' (N,) and 'final' (N,).
+    """
+    contributions = region_contributions(affected, proportions)
+    stats["calls"] += 1
+    stats["rows"] += contributions.shape[0]
+    visual = visual_bsa(contributions)
+    if palm_counts is None:
+        final = visual
+    else:
+        final = np.maximum(np.asarray(palm_counts, dtype=np.float64), visual)
+    return {'contributions': contributions, 'visual': visual, 'final': final}
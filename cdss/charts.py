@@ -0,0 +1,42 @@
+"""Plotly figures shared across reruns and sessions
+
+Building a figure with plotly.express (a DataFrame, trace validation, the
+colour scale and layout) costs far more than drawing it. Figures are
+memoised on their inputs in a bounded LRU cache at module level, so a
+session's reruns reuse the figure built when it scored. Sessions seldom
+share one: the DLQI domain scores have thousands of combinations, and
+python -m benchmarks.dlqi_chart measures how often a session's first
+scoring finds its figure already built.
+
+Returned figures are shared: callers pass them straight to
+st.plotly_chart and must not modify them.
+"""
+from functools import lru_cache
+
+# One figure per concurrently active session. Each figure holds about 125 KB,
+# and first scorings hit only about 1% of the time at this size (9% at 512),
+# so a larger cache buys little sharing between sessions for its memory.
+DLQI_FIGURE_CACHE_SIZE = 64
+
+
+@lru_cache(maxsize=DLQI_FIGURE_CACHE_SIZE)
+def dlqi_domain_figure(domain_scores):
+    """Bar chart of DLQI domain impact scores
+
+    domain_scores is a tuple of (domain name, score) pairs in display order.
+    """
+    import plotly.express as px
+
+    domains = [domain for domain, _ in domain_scores]
+    scores = [score for _, score in domain_scores]
+    fig = px.bar(
+        x=domains,
+        y=scores,
+        title="DLQI Domain Impact Scores",
+        labels={'x': 'Life Domain', 'y': 'Impact Score'},
+        color=scores,
+        color_continuous_scale='RdYlBu_r'
+    )
+    fig.update_layout(showlegend=False, height=300)
+    fig.update_xaxes(tickangle=45)
+    return fig
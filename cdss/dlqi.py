@@ -0,0 +1,86 @@
+"""Batch DLQI (Dermatology Life Quality Index) engine
+
+Answer matrices are shaped (N, 10): one row per questionnaire, one column
+per question in DLQI_QUESTIONS order, holding the selected option index.
+Unanswered questions are UNANSWERED (-1) or NaN.
+"""
+import numpy as np
+
+from cdss import knowledge
+
+UNANSWERED = -1
+
+# Calls and rows scored since the process started, read by cdss.metrics
+stats = {"calls": 0, "rows": 0}
+
+
+@knowledge.cached_by_version
+def questionnaire(pack):
+    """DLQI questions and the arrays derived from them, rebuilt when the knowledge pack changes
+
+    Keys: 'DLQI_QUESTIONS' (questionnaire text and options), 'DLQI_DOMAINS'
+    (domains in questionnaire order, as grouped by the DLQI page),
+    'DOMAIN_MATRIX' (10, 6) one-hot question-to-domain matrix and
+    'SPECIAL_QUESTIONS', the questions whose first option is "Not relevant":
+    option 0 scores 0 and every other option scores one less than its index.
+    """
+    questions = pack["dlqi_questions"]
+    domains = tuple(dict.fromkeys(q["domain"] for q in questions))
+    domain_matrix = np.array([
+        [q["domain"] == domain for domain in domains] for q in questions
+    ], dtype=np.float32)
+    special = np.array([bool(q.get("special")) for q in questions])
+    domain_matrix.flags.writeable = False
+    special.flags.writeable = False
+    return {
+        'DLQI_QUESTIONS': questions,
+        'DLQI_DOMAINS': domains,
+        'DOMAIN_MATRIX': domain_matrix,
+        'SPECIAL_QUESTIONS': special
+    }
+
+
+def __getattr__(name):
+    """DLQI_QUESTIONS, DLQI_DOMAINS, DOMAIN_MATRIX and SPECIAL_QUESTIONS track the current knowledge pack"""
+    try:
+        return questionnaire()[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+
+def score_dlqi(answers):
+    """Score a batch of DLQI questionnaires
+
+    Returns a dict of arrays: 'scores' (N, 10) per-question scores,
+    'total' (N,), 'answered' (N,) answered-question counts,
+    'domain_scores' (N, 6) and 'domain_answered' (N, 6) in the order of
+    'domains', the DLQI_DOMAINS of the pack version that scored them.
+    """
+    q = questionnaire()
+    question_count = len(q['DLQI_QUESTIONS'])
+
+    raw = np.asarray(answers)
+    if raw.ndim == 1:
+        raw = raw[np.newaxis]
+    if raw.ndim != 2 or raw.shape[1] != question_count:
+        raise ValueError(f"expected answers shaped (N, {question_count}), got {raw.shape}")
+
+    if raw.dtype.kind == 'f':
+        raw = np.nan_to_num(raw, nan=UNANSWERED)
+    options = raw.astype(np.int16, copy=False)
+    stats["calls"] += 1
+    stats["rows"] += options.shape[0]
+
+    answered = options >= 0
+    scores = np.maximum(options, 0) - (q['SPECIAL_QUESTIONS'] & (options > 0))
+
+    # Domain sums go through a float32 matmul, which is exact for these
+    # small integers and much faster than NumPy's integer matmul
+    return {
+        'scores': scores,
+        'total': scores.sum(axis=1, dtype=np.int32),
+        'answered': answered.sum(axis=1, dtype=np.int32),
+        'domain_scores': (scores.astype(np.float32) @ q['DOMAIN_MATRIX']).astype(np.int32),
+        'domain_answered': (answered.astype(np.float32) @ q['DOMAIN_MATRIX']).astype(np.int32),
+        'domains': q['DLQI_DOMAINS']
+    }
@@ -0,0 +1,92 @@
+"""Self-hosted web fonts, subset to Latin and served from static/fonts/
+
+The Severity Assessment page is set in Open Sans. It used to @import the
+Google Fonts stylesheet, a render-blocking request to a third-party host on
+every load that hangs until timeout on offline kiosks. The font files are
+now published as content-hashed static assets and style.build() prepends
+an @font-face rule for each one (font-display: swap, so text paints in the
+fallback font straight away and switches once the file arrives).
+
+Files are subset to the Latin range below, which covers everything the
+pages print; unicode-range tells browsers to use the fallback font for any
+other character instead of downloading a larger file. Subsetting needs
+fontTools with brotli (a build-time tool, not an app dependency):
+
+    pip install fonttools brotli
+    python -m cdss.fonts publish OpenSans-Regular.ttf --name open-sans-400.woff2
+    python -m cdss.style build
+"""
+import argparse
+import io
+
+from cdss import assets
+
+# Google Fonts' "latin" subset plus ≤ ≥, in CSS unicode-range syntax
+LATIN_RANGE = (
+    "U+0000-00FF, U+0131, U+0152-0153, U+02BB-02BC, U+02C6, U+02DA, U+02DC, "
+    "U+2000-206F, U+2074, U+20AC, U+2122, U+2191, U+2193, U+2212, U+2215, "
+    "U+2264-2265, U+FEFF, U+FFFD"
+)
+
+# (family, weight, style, asset name) for every published face; weights
+# 400, 600 and 700 are the ones the stylesheet uses
+FONT_FACES = (
+    ("Open Sans", 400, "normal", "open-sans-400.woff2"),
+    ("Open Sans", 400, "italic", "open-sans-400-italic.woff2"),
+    ("Open Sans", 600, "normal", "open-sans-600.woff2"),
+    ("Open Sans", 700, "normal", "open-sans-700.woff2"),
+)
+
+
+def subset(data, unicodes=LATIN_RANGE):
+    """WOFF2 bytes of the font in data (TTF, OTF, WOFF or WOFF2) cut down to unicodes"""
+    from fontTools import subset as font_subset
+    from fontTools.ttLib import TTFont
+
+    font = TTFont(io.BytesIO(data))
+    options = font_subset.Options()
+    options.flavor = "woff2"
+    subsetter = font_subset.Subsetter(options)
+    subsetter.populate(unicodes=font_subset.parse_unicodes(unicodes))
+    subsetter.subset(font)
+
+    out = io.BytesIO()
+    font.flavor = "woff2"
+    font.save(out)
+    return out.getvalue()
+
+
+def font_face_css():
+    """@font-face rules for the published faces; faces not yet published are skipped"""
+    manifest = assets.load_manifest()
+    rules = []
+    for family, weight, style, name in FONT_FACES:
+        if name not in manifest:
+            continue
+        rules.append(
+            f"@font-face{{font-family:'{family}';font-style:{style};font-weight:{weight};"
+            f"font-display:swap;src:url({assets.static_url(name)}) format('woff2');"
+            f"unicode-range:{LATIN_RANGE.replace(' ', '')}}}"
+        )
+    return "".join(rules)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Subset and publish self-hosted web fonts")
+    commands = parser.add_subparsers(dest="command", required=True)
+    publish_cmd = commands.add_parser("publish", help="subset a font file to Latin and publish it as WOFF2")
+    publish_cmd.add_argument("source", help="TTF, OTF, WOFF or WOFF2 file")
+    publish_cmd.add_argument("--name", required=True, choices=[face[3] for face in FONT_FACES],
+                             help="asset name of the face it provides")
+    args = parser.parse_args()
+
+    with open(args.source, "rb") as f:
+        data = f.read()
+    woff2 = subset(data)
+    path = assets.publish(woff2, args.name, subdir="fonts")
+    print(f"{args.name} -> {assets.STATIC_URL_PREFIX}{path} ({len(data)} -> {len(woff2)} bytes)")
+    print("run 'python -m cdss.style build' to update the stylesheet")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,341 @@
+"""Disk-backed read-through cache for remote reference images
+
+Pages pass remote image URLs through local_image(), which returns a local
+file path when the image is cached. Given the display width, it returns a
+scaled-down WebP variant of the cached file instead (see cdss.thumbnails).
+A page run never waits on the network or the image encoder: a miss gets
+the bundled placeholder, and a hit without its variant yet gets the
+original file, while a background thread fetches the image and builds the
+variant for a later rerun. A failed fetch pauses all background fetching for RETRY_AFTER_SECONDS,
+so air-gapped wards get a usable page without repeated timeouts. Populate
+the cache ahead of time with the prefetch command:
+
+    python -m cdss.image_cache prefetch
+    python -m cdss.image_cache stats
+
+Configuration (environment variables):
+    CDSS_IMAGE_CACHE_DIR      cache directory (default: .image_cache in the repo)
+    CDSS_IMAGE_CACHE_MAX_MB   size cap; least recently used files are evicted (default: 200)
+    CDSS_IMAGE_CACHE_OFFLINE  set to 1 to never fetch in the background (prefetch still works)
+"""
+import argparse
+import hashlib
+import os
+import queue
+import threading
+import time
+import urllib.error
+import urllib.request
+
+from cdss import assets
+from cdss import thumbnails
+
+CACHE_DIR = os.environ.get("CDSS_IMAGE_CACHE_DIR", os.path.join(assets.ROOT_DIR, ".image_cache"))
+MAX_BYTES = int(float(os.environ.get("CDSS_IMAGE_CACHE_MAX_MB", "200")) * 1024 * 1024)
+OFFLINE = os.environ.get("CDSS_IMAGE_CACHE_OFFLINE", "") not in ("", "0")
+
+PLACEHOLDER_ASSET = "image-unavailable.png"
+
+# Background fetches queue behind each other, so keep them short; the
+# prefetch command can afford to wait longer
+FETCH_TIMEOUT = 3
+PREFETCH_TIMEOUT = 20
+
+# After a network failure, stop all background fetching for this long. On an
+# air-gapped ward every fetch fails, so one failure stands for all of them.
+RETRY_AFTER_SECONDS = 300
+
+# Evict down to this fraction of MAX_BYTES so every write doesn't trigger a scan
+EVICT_TO_FRACTION = 0.9
+
+USER_AGENT = "Mozilla/5.0 (compatible; psoriasis-cdss image cache)"
+
+# Leading bytes of the formats the reference galleries use
+_SIGNATURES = (
+    (b"\xff\xd8\xff", ".jpg"),
+    (b"\x89PNG\r\n\x1a\n", ".png"),
+    (b"GIF87a", ".gif"),
+    (b"GIF89a", ".gif"),
+)
+
+_EXTENSIONS = (".jpg", ".png", ".gif", ".webp")
+
+_lock = threading.Lock()
+_fetch_queue = queue.Queue()
+_pending = set()
+_fetcher = {}
+_breaker = {"open_until": 0.0}
+stats = {"hits": 0, "misses": 0, "fetch_errors": 0, "placeholders": 0, "variant_errors": 0}
+
+
+def is_remote(url):
+    """Whether url is an http(s) image this cache can hold"""
+    return url.startswith(("http://", "https://"))
+
+
+def url_key(url):
+    """Cache file stem for url"""
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+
+
+def image_extension(data):
+    """File extension for image bytes, or None if the format is not recognised"""
+    for signature, extension in _SIGNATURES:
+        if data.startswith(signature):
+            return extension
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return ".webp"
+    return None
+
+
+def cached_path(url):
+    """Path of the cached copy of url, or None if it is not cached"""
+    stem = os.path.join(CACHE_DIR, url_key(url))
+    for extension in _EXTENSIONS:
+        path = stem + extension
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def fetch(url, timeout=FETCH_TIMEOUT):
+    """Download url and store it in the cache; returns the cached path"""
+    request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        data = response.read()
+
+    extension = image_extension(data)
+    if extension is None:
+        raise ValueError(f"not an image: {url}")
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = os.path.join(CACHE_DIR, url_key(url) + extension)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+    evict()
+    return path
+
+
+def local_image(url, width=None):
+    """Source to pass to st.image for url
+
+    Remote URLs resolve to a cached file, or to its width-px variant when
+    width is given. On a miss the URL is queued for a background fetch and
+    the bundled placeholder is returned. data: URIs and local paths are
+    returned unchanged.
+    """
+    if not is_remote(url):
+        return url
+
+    # evict() may remove the file between the lookup and its use; that is a miss
+    path = cached_path(url)
+    if path is not None and _touch(path):
+        source = _variant(url, path, width)
+        if source is not None:
+            stats["hits"] += 1
+            return source
+
+    stats["misses"] += 1
+    _schedule_fetch(url, width)
+    stats["placeholders"] += 1
+    return assets.image_source(PLACEHOLDER_ASSET)
+
+
+def _fetching_paused():
+    return OFFLINE or time.monotonic() < _breaker["open_until"]
+
+
+def _schedule_fetch(url, width):
+    """Queue url for a background fetch unless fetching is off or paused"""
+    if not _fetching_paused():
+        _schedule(url, width)
+
+
+def _schedule(url, width):
+    """Queue url for the background worker unless it is queued already"""
+    with _lock:
+        if (url, width) in _pending:
+            return
+        _pending.add((url, width))
+        if not _fetcher:
+            _fetcher["thread"] = threading.Thread(target=_fetch_worker, name="cdss-image-fetch", daemon=True)
+            _fetcher["thread"].start()
+    _fetch_queue.put((url, width))
+
+
+def _fetch_worker():
+    """Fetch queued URLs that are not cached and build their variants, one at a time"""
+    while True:
+        url, width = _fetch_queue.get()
+        try:
+            path = cached_path(url) or _background_fetch(url)
+            if path is not None and width is not None:
+                try:
+                    thumbnails.build_variant(path, width)
+                except Exception:
+                    stats["variant_errors"] += 1
+        finally:
+            with _lock:
+                _pending.discard((url, width))
+            _fetch_queue.task_done()
+
+
+def _background_fetch(url):
+    """fetch(url) for the worker; None when it fails or fetching is paused"""
+    if _fetching_paused():
+        return None
+    try:
+        return fetch(url)
+    except urllib.error.HTTPError:
+        # The host answered, so the network is up; only this URL failed
+        stats["fetch_errors"] += 1
+    except OSError:
+        stats["fetch_errors"] += 1
+        _breaker["open_until"] = time.monotonic() + RETRY_AFTER_SECONDS
+    except Exception:
+        stats["fetch_errors"] += 1
+    return None
+
+
+def _variant(url, path, width):
+    """The width-px variant of a cached file, the file itself, or None once either is evicted
+
+    A variant that is not built yet is queued for the background worker and
+    the original served meanwhile; encoding never runs on the page's thread.
+    """
+    if width is None:
+        return path
+    try:
+        variant = thumbnails.existing_variant(path, width)
+    except FileNotFoundError:
+        return None
+    if variant is None:
+        _schedule(url, width)
+        return path
+    return variant if _touch(variant) else None
+
+
+def _touch(path):
+    """Mark a cached file as recently used for LRU eviction; False if it is gone"""
+    try:
+        os.utime(path)
+    except OSError:
+        return False
+    return True
+
+
+def _cache_entries():
+    """(mtime, size, path) for every cached image"""
+    entries = []
+    try:
+        with os.scandir(CACHE_DIR) as it:
+            for entry in it:
+                if entry.is_file() and not entry.name.endswith(".tmp"):
+                    info = entry.stat()
+                    entries.append((info.st_mtime, info.st_size, entry.path))
+    except FileNotFoundError:
+        pass
+    return entries
+
+
+def evict(max_bytes=None):
+    """Delete least recently used images until the cache fits its size cap
+
+    Returns the number of files removed.
+    """
+    max_bytes = MAX_BYTES if max_bytes is None else max_bytes
+    with _lock:
+        entries = _cache_entries()
+        total = sum(size for _, size, _ in entries)
+        if total <= max_bytes:
+            return 0
+
+        removed = 0
+        target = max_bytes * EVICT_TO_FRACTION
+        for _, size, path in sorted(entries):
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            thumbnails.forget(path)
+            total -= size
+            removed += 1
+        return removed
+
+
+def reference_images():
+    """Display widths of the remote reference images, keyed by URL"""
+    from cdss.psoriasis_types import PSORIASIS_TYPES
+    from cdss.screening import SCREENING_QUESTIONS
+
+    widths = {}
+    for data in PSORIASIS_TYPES.values():
+        for images in data["locations"].values():
+            widths.update(dict.fromkeys(images, thumbnails.GALLERY_WIDTH))
+    widths.update((q["image"], thumbnails.SCREENING_WIDTH) for q in SCREENING_QUESTIONS if "image" in q)
+    return {url: width for url, width in widths.items() if is_remote(url)}
+
+
+def reference_image_urls():
+    """Every remote reference image URL used by the pages"""
+    return list(reference_images())
+
+
+def prefetch(images=None, force=False):
+    """Download reference images and build their display-width variants
+
+    images maps URL to display width (None for no variant); returns
+    (fetched, skipped, failed URLs).
+    """
+    fetched, skipped, failed = 0, 0, []
+    images = reference_images() if images is None else images
+    for url, width in images.items():
+        path = None if force else cached_path(url)
+        try:
+            if path is None:
+                path = fetch(url, timeout=PREFETCH_TIMEOUT)
+                fetched += 1
+            else:
+                skipped += 1
+            if width is not None:
+                thumbnails.build_variant(path, width)
+        except Exception as exc:
+            failed.append((url, exc))
+    return fetched, skipped, failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the local reference image cache")
+    commands = parser.add_subparsers(dest="command", required=True)
+    prefetch_cmd = commands.add_parser("prefetch", help="download every reference image")
+    prefetch_cmd.add_argument("--force", action="store_true", help="re-download cached images")
+    commands.add_parser("stats", help="show cache size and coverage")
+    commands.add_parser("clear", help="delete every cached image")
+    args = parser.parse_args()
+
+    if args.command == "prefetch":
+        fetched, skipped, failed = prefetch(force=args.force)
+        print(f"fetched {fetched}, already cached {skipped}, failed {len(failed)}")
+        for url, exc in failed:
+            print(f"  FAILED {url}: {exc}")
+        raise SystemExit(1 if failed else 0)
+    elif args.command == "stats":
+        entries = _cache_entries()
+        urls = reference_image_urls()
+        cached = sum(cached_path(url) is not None for url in urls)
+        size = sum(size for _, size, _ in entries)
+        print(f"{CACHE_DIR}: {len(entries)} files, {size / 1024 / 1024:.1f} MB of {MAX_BYTES / 1024 / 1024:.0f} MB")
+        variants = sum(path.endswith(thumbnails.VARIANT_EXTENSION) and ".w" in os.path.basename(path) for _, _, path in entries)
+        print(f"reference images cached: {cached}/{len(urls)}, display-width variants: {variants}")
+    else:
+        removed = evict(max_bytes=0)
+        print(f"removed {removed} files")
+
+
+if __name__ == "__main__":
+    main()
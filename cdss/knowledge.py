@@ -0,0 +1,194 @@
+"""Versioned, hot-reloadable clinical knowledge pack
+
+Static clinical content (psoriasis types and their reference images, the
+DLQI questionnaire, medication reference, glossary and epidemiology table)
+lives in knowledge_pack.json rather than in page literals that Streamlit
+rebuilds on every rerun. load_pack() parses it once and returns a frozen
+structure (mappings become read-only proxies, lists become tuples) that
+every session shares.
+
+The file is watched: at most every RELOAD_INTERVAL seconds load_pack()
+checks its mtime and size, and a changed file is parsed, validated and
+swapped in as a whole, so readers see either the old pack or the new one.
+A file that fails to parse (for example while it is being written) leaves
+the current pack in place. Each loaded pack carries a version stamp,
+"<content_version>+<sha12 of the file>"; caches derived from the pack are
+keyed on it with cached_by_version() so they never serve stale content.
+
+    from cdss import knowledge
+    glossary = knowledge.load_pack()["glossary"]
+
+Install a new pack without restarting the app (validates, then atomically
+replaces the file):
+
+    python -m cdss.knowledge install new_pack.json
+    python -m cdss.knowledge check [PATH]
+"""
+import argparse
+import functools
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from types import MappingProxyType
+
+PACK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "knowledge_pack.json")
+
+# Bump when the pack layout changes in a way older code cannot read
+SCHEMA_VERSION = 1
+
+SECTIONS = ("psoriasis_types", "dlqi_questions", "medications", "glossary", "epidemiology")
+
+# Seconds between checks of the pack file for changes
+RELOAD_INTERVAL = float(os.environ.get("CDSS_KNOWLEDGE_RELOAD_SECONDS", "2"))
+
+HASH_LENGTH = 12
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_loaded = {}
+
+
+class KnowledgePackError(ValueError):
+    """The knowledge pack is missing sections or has an unsupported schema"""
+
+
+def freeze(value):
+    """Read-only copy of parsed JSON: dicts become mapping proxies, lists tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def parse_pack(data):
+    """Validate and freeze a decoded knowledge pack"""
+    if data.get("schema_version") != SCHEMA_VERSION:
+        raise KnowledgePackError(
+            f"unsupported knowledge pack schema {data.get('schema_version')!r} (expected {SCHEMA_VERSION})"
+        )
+    missing = [section for section in SECTIONS if section not in data]
+    if missing:
+        raise KnowledgePackError(f"knowledge pack is missing sections: {', '.join(missing)}")
+    return freeze(data)
+
+
+def read_pack(path):
+    """(frozen pack, version stamp) for the pack file at path"""
+    with open(path, "rb") as f:
+        raw = f.read()
+    pack = parse_pack(json.loads(raw))
+    version = f"{pack['content_version']}+{hashlib.sha256(raw).hexdigest()[:HASH_LENGTH]}"
+    return pack, version
+
+
+def _file_stamp(path):
+    info = os.stat(path)
+    return info.st_mtime_ns, info.st_size
+
+
+def current(path=PACK_PATH):
+    """The loaded pack entry for path: a dict with 'pack' and 'version'
+
+    Reloads the file if it changed since the last check.
+    """
+    entry = _loaded.get(path)
+    now = time.monotonic()
+    if entry is not None and now - entry["checked"] < RELOAD_INTERVAL:
+        return entry
+
+    with _lock:
+        entry = _loaded.get(path)
+        if entry is not None and now - entry["checked"] < RELOAD_INTERVAL:
+            return entry
+        stamp = None
+        try:
+            stamp = _file_stamp(path)
+            if entry is not None and stamp in (entry["stamp"], entry.get("rejected")):
+                entry["checked"] = now
+                return entry
+            pack, version = read_pack(path)
+        except (OSError, ValueError) as exc:
+            if entry is None:
+                raise
+            # Keep serving the current pack; the same bad file is not parsed again
+            logger.warning("keeping knowledge pack %s; reload of %s failed: %s", entry["version"], path, exc)
+            entry["checked"] = now
+            entry["rejected"] = stamp
+            return entry
+
+        if entry is not None:
+            logger.info("knowledge pack %s replaced by %s", entry["version"], version)
+        entry = {"pack": pack, "version": version, "stamp": stamp, "checked": now}
+        _loaded[path] = entry
+        return entry
+
+
+def load_pack(path=PACK_PATH):
+    """The current knowledge pack at path"""
+    return current(path)["pack"]
+
+
+def pack_version(path=PACK_PATH):
+    """Version stamp of the current pack: content version plus file hash"""
+    return current(path)["version"]
+
+
+def content_version(path=PACK_PATH):
+    """Content version string of the current pack"""
+    return load_pack(path)["content_version"]
+
+
+def cached_by_version(fn):
+    """Cache fn(pack) until the knowledge pack changes
+
+    The decorated function takes no arguments; it is called with the
+    current pack and its result is reused while the pack version is the same.
+    """
+    cache = {}
+
+    @functools.wraps(fn)
+    def wrapper():
+        entry = current()
+        hit = cache.get("result")
+        if hit is None or hit[0] != entry["version"]:
+            hit = (entry["version"], fn(entry["pack"]))
+            cache["result"] = hit
+        return hit[1]
+
+    return wrapper
+
+
+def install(source, path=PACK_PATH):
+    """Validate the pack at source and atomically replace the pack at path with it"""
+    pack, version = read_pack(source)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    shutil.copyfile(source, tmp_path)
+    os.replace(tmp_path, path)
+    return version
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check or install the clinical knowledge pack")
+    commands = parser.add_subparsers(dest="command", required=True)
+    check_cmd = commands.add_parser("check", help="validate a pack file")
+    check_cmd.add_argument("path", nargs="?", default=PACK_PATH)
+    install_cmd = commands.add_parser("install", help="validate a pack and swap it in for running apps")
+    install_cmd.add_argument("path")
+    args = parser.parse_args()
+
+    if args.command == "check":
+        pack, version = read_pack(args.path)
+        print(f"{args.path}: knowledge pack {version}, sections: {', '.join(SECTIONS)}")
+    else:
+        version = install(args.path)
+        print(f"installed knowledge pack {version}; running apps pick it up within {RELOAD_INTERVAL:g}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+"""Prometheus text-format metrics for the running app
+
+Every page calls metrics.start_exporter() next to perf.start_page(). The
+first call in a process starts a small HTTP server on a background thread
+that answers GET /metrics in the Prometheus text format (version 0.0.4):
+
+    cdss_rerun_duration_seconds     histogram of rerun wall time, by page and kind
+    cdss_reruns_total               reruns by page, kind and status (page hits)
+    cdss_rerun_elements_total       elements sent, by page
+    cdss_rerun_payload_bytes_total  approximate delta bytes sent, by page
+    cdss_active_sessions            sessions with a rerun in the last 5 minutes
+    cdss_image_cache_*              reference image cache hits, misses, hit ratio and errors
+    cdss_engine_calls_total         scoring engine calls, by engine
+    cdss_engine_rows_total          assessments scored, by engine
+
+Rerun figures come from cdss.perf records; the cache and engine figures are
+read from the modules' stats dicts at scrape time. Engines are looked up in
+sys.modules rather than imported, so light pages don't load NumPy and the
+engines just to export metrics; an engine no page has used yet is left out. p95 rerun time per page:
+
+    histogram_quantile(0.95, sum by (page, le) (rate(cdss_rerun_duration_seconds_bucket[5m])))
+
+Configuration (environment variables):
+
+    CDSS_METRICS_PORT=9464       port to listen on; 0 disables the exporter
+    CDSS_METRICS_HOST=127.0.0.1  interface to bind
+"""
+import http.server
+import logging
+import os
+import sys
+import threading
+import time
+
+from cdss import image_cache, perf
+
+PORT = int(os.environ.get("CDSS_METRICS_PORT", "9464"))
+HOST = os.environ.get("CDSS_METRICS_HOST", "127.0.0.1")
+
+# Upper bounds in seconds; Streamlit reruns range from a few ms to seconds
+DURATION_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# A session counts as active while it has rerun within this many seconds
+ACTIVE_SESSION_SECONDS = 300
+
+# Scoring engines under cdss whose stats dicts are exported
+ENGINES = ("pasi", "bsa", "dlqi", "screening", "treatment")
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_reruns = {}
+_durations = {}
+_elements = {}
+_payload_bytes = {}
+_sessions = {}
+_server = {}
+
+
+def observe_run(record):
+    """Fold one finished perf record into the counters"""
+    page, kind = record["page"], record["kind"]
+    seconds = record["ms"] / 1000
+    with _lock:
+        key = (page, kind, record["status"])
+        _reruns[key] = _reruns.get(key, 0) + 1
+
+        histogram = _durations.get((page, kind))
+        if histogram is None:
+            histogram = _durations[(page, kind)] = {"buckets": [0] * len(DURATION_BUCKETS), "sum": 0.0, "count": 0}
+        for i, bound in enumerate(DURATION_BUCKETS):
+            if seconds <= bound:
+                histogram["buckets"][i] += 1
+        histogram["sum"] += seconds
+        histogram["count"] += 1
+
+        _elements[page] = _elements.get(page, 0) + record["elements"]
+        _payload_bytes[page] = _payload_bytes.get(page, 0) + record["bytes"]
+        _sessions[record["session"]] = time.monotonic()
+
+
+perf.add_listener(observe_run)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels):
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def _bound(value):
+    return "+Inf" if value == float("inf") else repr(value)
+
+
+def active_sessions():
+    """Sessions that reran within ACTIVE_SESSION_SECONDS; forgets older ones"""
+    cutoff = time.monotonic() - ACTIVE_SESSION_SECONDS
+    with _lock:
+        for session, seen in list(_sessions.items()):
+            if seen < cutoff:
+                del _sessions[session]
+        return len(_sessions)
+
+
+def engine_stats():
+    """(engine, stats dict) for each scoring engine this process has imported"""
+    loaded = []
+    for engine in ENGINES:
+        module = sys.modules.get(f"cdss.{engine}")
+        if module is not None:
+            loaded.append((engine, module.stats))
+    return loaded
+
+
+def render():
+    """All metrics in the Prometheus text exposition format"""
+    lines = []
+
+    def metric(name, kind, help_text, samples):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for suffix, labels, value in samples:
+            lines.append(f"{name}{suffix}{_labels(**labels) if labels else ''} {value}")
+
+    with _lock:
+        reruns = sorted(_reruns.items())
+        durations = sorted((key, dict(value, buckets=list(value["buckets"]))) for key, value in _durations.items())
+        elements = sorted(_elements.items())
+        payload_bytes = sorted(_payload_bytes.items())
+
+    samples = []
+    for (page, kind), histogram in durations:
+        for bound, count in zip(DURATION_BUCKETS + (float("inf"),), histogram["buckets"] + [histogram["count"]]):
+            samples.append(("_bucket", {"page": page, "kind": kind, "le": _bound(bound)}, count))
+        samples.append(("_sum", {"page": page, "kind": kind}, repr(histogram["sum"])))
+        samples.append(("_count", {"page": page, "kind": kind}, histogram["count"]))
+    metric("cdss_rerun_duration_seconds", "histogram", "Wall time of page reruns and fragment reruns", samples)
+
+    metric("cdss_reruns_total", "counter", "Page reruns by page, kind (run or fragment) and status",
+           [("", {"page": page, "kind": kind, "status": status}, count)
+            for (page, kind, status), count in reruns])
+    metric("cdss_rerun_elements_total", "counter", "Elements sent to browsers",
+           [("", {"page": page}, count) for page, count in elements])
+    metric("cdss_rerun_payload_bytes_total", "counter", "Approximate serialized delta bytes sent to browsers",
+           [("", {"page": page}, count) for page, count in payload_bytes])
+    metric("cdss_active_sessions", "gauge", f"Sessions with a rerun in the last {ACTIVE_SESSION_SECONDS} seconds",
+           [("", None, active_sessions())])
+
+    cache = dict(image_cache.stats)
+    metric("cdss_image_cache_requests_total", "counter", "Reference image lookups by result",
+           [("", {"result": "hit"}, cache["hits"]), ("", {"result": "miss"}, cache["misses"])])
+    lookups = cache["hits"] + cache["misses"]
+    metric("cdss_image_cache_hit_ratio", "gauge", "Share of reference image lookups served from the cache",
+           [("", None, repr(cache["hits"] / lookups if lookups else 0.0))])
+    metric("cdss_image_cache_placeholders_total", "counter", "Images served as the unavailable placeholder",
+           [("", None, cache["placeholders"])])
+    metric("cdss_image_cache_errors_total", "counter", "Failed image fetches and variant builds",
+           [("", {"stage": "fetch"}, cache["fetch_errors"]), ("", {"stage": "variant"}, cache["variant_errors"])])
+
+    engines = engine_stats()
+    metric("cdss_engine_calls_total", "counter", "Scoring engine calls",
+           [("", {"engine": engine}, stats["calls"]) for engine, stats in engines])
+    metric("cdss_engine_rows_total", "counter", "Assessments scored by each engine",
+           [("", {"engine": engine}, stats["rows"]) for engine, stats in engines])
+
+    return "\n".join(lines) + "\n"
+
+
+class MetricsHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Scrapes every few seconds would flood the Streamlit log
+        pass
+
+
+def start_exporter(host=HOST, port=PORT):
+    """Serve /metrics on a daemon thread; only the first call in a process does anything"""
+    if port == 0 or _server:
+        return
+    with _lock:
+        if _server:
+            return
+        _server["address"] = (host, port)
+        try:
+            server = http.server.ThreadingHTTPServer((host, port), MetricsHandler)
+        except OSError as exc:
+            # Another app process on this host already exports; keep serving pages
+            logger.warning("metrics exporter not started on %s:%s: %s", host, port, exc)
+            return
+        server.daemon_threads = True
+        _server["server"] = server
+    threading.Thread(target=server.serve_forever, name="cdss-metrics", daemon=True).start()
+    logger.info("serving metrics on http://%s:%s/metrics", host, port)
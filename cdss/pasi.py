@@ -0,0 +1,94 @@
+"""Vectorized PASI (Psoriasis Area and Severity Index) engine
+
+Assessments are arrays shaped (N, 4, 4): N patients, the four PASI body
+regions in REGIONS order, and the four inputs in COMPONENTS order
+(erythema, induration, scaling, area percentage). A single (4, 4)
+assessment is also accepted and scored as a batch of one.
+"""
+from bisect import bisect_right
+
+import numpy as np
+
+# Body regions in scoring order with their PASI weight factors
+REGIONS = ('head', 'arms', 'trunk', 'legs')
+REGION_NAMES = ('Head/Neck', 'Upper Limbs', 'Trunk', 'Lower Limbs')
+REGION_WEIGHTS = np.array([0.1, 0.2, 0.3, 0.4])
+
+# Per-region input columns
+COMPONENTS = ('erythema', 'induration', 'scaling', 'area_percentage')
+ERYTHEMA, INDURATION, SCALING, AREA = range(4)
+
+
+# Lower edges of area scores 1-6. Scores 2 and up start just above 29, 49,
+# 69 and 89 because those bands are inclusive of their upper bound, while
+# score 2 starts at exactly 10 ("<10%" is score 1).
+AREA_SCORE_EDGES = np.array([
+    np.nextafter(0.0, 1.0),
+    10.0,
+    np.nextafter(29.0, 30.0),
+    np.nextafter(49.0, 50.0),
+    np.nextafter(69.0, 70.0),
+    np.nextafter(89.0, 90.0)
+])
+_AREA_SCORE_EDGES_LIST = AREA_SCORE_EDGES.tolist()
+
+# Area score for every whole percentage 0-100
+AREA_SCORE_TABLE = np.searchsorted(AREA_SCORE_EDGES, np.arange(101), side='right').astype(np.int8)
+_AREA_SCORE_LOOKUP = tuple(AREA_SCORE_TABLE.tolist())
+
+# Calls and rows scored since the process started, read by cdss.metrics
+stats = {"calls": 0, "rows": 0}
+
+
+def area_score(percentage):
+    """Convert a single area percentage to its PASI area score 0-6"""
+    if type(percentage) is int and 0 <= percentage <= 100:
+        return _AREA_SCORE_LOOKUP[percentage]
+    return bisect_right(_AREA_SCORE_EDGES_LIST, percentage)
+
+
+def area_to_score(percentages):
+    """Convert area percentages (any shape) to PASI area scores 0-6
+
+    Whole percentages are looked up in AREA_SCORE_TABLE; fractional
+    percentages, such as the BSA visual estimates, are binned with
+    searchsorted against AREA_SCORE_EDGES.
+    """
+    p = np.asarray(percentages)
+    if p.dtype.kind in 'iub':
+        return AREA_SCORE_TABLE.take(p, mode='clip')
+    return np.searchsorted(AREA_SCORE_EDGES, p, side='right').astype(np.int8)
+
+
+def score_pasi(assessments):
+    """Score a batch of PASI assessments in one vectorized pass
+
+    Returns a dict of arrays: 'area_score' and 'severity_sum' (N, 4),
+    'regional_pasi' (N, 4) and 'total_pasi' (N,).
+    """
+    data = np.asarray(assessments)
+    if data.dtype.kind not in 'iuf':
+        data = data.astype(np.float64)
+    if data.ndim == 2:
+        data = data[np.newaxis]
+    if data.shape[1:] != (len(REGIONS), len(COMPONENTS)):
+        raise ValueError(
+            f"expected assessments shaped (N, {len(REGIONS)}, {len(COMPONENTS)}), got {data.shape}"
+        )
+
+    stats["calls"] += 1
+    stats["rows"] += data.shape[0]
+
+    area_score = area_to_score(data[:, :, AREA])
+    severity_sum = data[:, :, ERYTHEMA] + data[:, :, INDURATION] + data[:, :, SCALING]
+    regional_pasi = REGION_WEIGHTS * severity_sum * area_score
+
+    # Sum regions left to right so totals match the per-patient page exactly
+    total_pasi = regional_pasi[:, 0] + regional_pasi[:, 1] + regional_pasi[:, 2] + regional_pasi[:, 3]
+
+    return {
+        'area_score': area_score,
+        'severity_sum': severity_sum,
+        'regional_pasi': regional_pasi,
+        'total_pasi': total_pasi
+    }
@@ -0,0 +1,254 @@
+"""Per-rerun performance records for every page
+
+Each page calls start_page() near the top and end_page() at the bottom.
+In between, perf records:
+
+- wall time of the rerun and of each named section (perf.section, used as
+  a decorator or a with block; repeated sections are summed with a call count)
+- the number of elements the rerun sent to the browser
+- approximate delta payload: the serialized size of those messages
+
+Elements and bytes are counted by wrapping the session's forward-message
+queue for the duration of the run. Finished runs are appended as JSON lines
+to LOG_PATH and kept in a small in-memory buffer that the diagnostics panel
+reads, and are passed to listeners registered with add_listener(). The
+panel is hidden; add ?diagnostics=1 to the page URL to show it in the sidebar.
+
+A run that stops early (st.rerun, st.stop or an exception) never reaches
+end_page(); it is closed with status "interrupted" when the session's next
+run starts. Fragment reruns skip the page script, so a section entered
+with no page run active (a decorated fragment function) records its own run
+with kind "fragment".
+
+Configuration (environment variables):
+
+    CDSS_PERF=0                  turn instrumentation off
+    CDSS_PERF_LOG=path           JSON lines file (default .perf/reruns.jsonl;
+                                 empty to keep records in memory only)
+    CDSS_PERF_LOG_MAX_MB=50      rotate the log to <path>.1 past this size
+"""
+import contextlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from cdss import assets
+
+ENABLED = os.environ.get("CDSS_PERF", "1") not in ("", "0")
+LOG_PATH = os.environ.get("CDSS_PERF_LOG", os.path.join(assets.ROOT_DIR, ".perf", "reruns.jsonl"))
+LOG_MAX_BYTES = int(float(os.environ.get("CDSS_PERF_LOG_MAX_MB", "50")) * 1024 * 1024)
+
+# Finished runs kept for the diagnostics panel, across all sessions
+RECENT_RUNS = 200
+
+# Open runs idle this long belong to sessions that went away; they are closed
+STALE_SECONDS = 600
+
+PANEL_QUERY_PARAM = "diagnostics"
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_active = {}
+_recent = deque(maxlen=RECENT_RUNS)
+_listeners = []
+
+
+def _session_id(ctx):
+    return ctx.session_id if ctx is not None else "bare"
+
+
+def _open_run(ctx, page, kind):
+    """Start a run record and count the messages it sends"""
+    now = time.perf_counter()
+    run = {
+        "page": page,
+        "kind": kind,
+        "session": _session_id(ctx)[:8],
+        "started": now,
+        "last": now,
+        "elements": 0,
+        "bytes": 0,
+        "sections": {},
+        "ctx": ctx,
+        "enqueue": None,
+    }
+    if ctx is not None and hasattr(ctx, "_enqueue"):
+        enqueue = ctx._enqueue
+
+        def counting_enqueue(msg):
+            if msg.HasField("delta"):
+                if msg.delta.WhichOneof("type") == "new_element":
+                    run["elements"] += 1
+                run["bytes"] += msg.ByteSize()
+                run["last"] = time.perf_counter()
+            enqueue(msg)
+
+        run["enqueue"] = enqueue
+        ctx._enqueue = counting_enqueue
+    return run
+
+
+def _close_run(run, status, end=None):
+    """Stop counting, then log and buffer the finished record"""
+    if run["enqueue"] is not None:
+        run["ctx"]._enqueue = run["enqueue"]
+    end = run["last"] if end is None else end
+    record = {
+        "ts": round(time.time(), 3),
+        "page": run["page"],
+        "kind": run["kind"],
+        "status": status,
+        "session": run["session"],
+        "ms": round((end - run["started"]) * 1000, 2),
+        "elements": run["elements"],
+        "bytes": run["bytes"],
+        "sections": {
+            name: {"ms": round(seconds * 1000, 2), "calls": calls}
+            for name, (seconds, calls) in run["sections"].items()
+        },
+    }
+    with _lock:
+        _recent.append(record)
+    if LOG_PATH:
+        _write(record)
+    for listener in _listeners:
+        try:
+            listener(record)
+        except Exception:
+            logger.exception("perf listener %r failed", listener)
+    return record
+
+
+def add_listener(listener):
+    """Call listener(record) with every finished run record (cdss.metrics uses this)"""
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+def _write(record):
+    line = json.dumps(record, separators=(",", ":")) + "\n"
+    with _lock:
+        try:
+            os.makedirs(os.path.dirname(LOG_PATH), exist_ok=True)
+            if os.path.exists(LOG_PATH) and os.path.getsize(LOG_PATH) > LOG_MAX_BYTES:
+                os.replace(LOG_PATH, LOG_PATH + ".1")
+            with open(LOG_PATH, "a", encoding="utf-8") as f:
+                f.write(line)
+        except OSError:
+            # Diagnostics must never take a page down
+            pass
+
+
+def _close_stale(now):
+    for session, run in list(_active.items()):
+        if now - run["last"] > STALE_SECONDS:
+            _active.pop(session, None)
+            _close_run(run, "interrupted")
+
+
+def start_page(page):
+    """Begin timing this rerun of page; closes the session's previous run if it stopped early"""
+    if not ENABLED:
+        return
+    ctx = get_script_run_ctx()
+    previous = _active.pop(_session_id(ctx), None)
+    if previous is not None:
+        _close_run(previous, "interrupted")
+    _close_stale(time.perf_counter())
+    _active[_session_id(ctx)] = _open_run(ctx, page, "run")
+
+
+def end_page():
+    """Finish this rerun's record; shows the diagnostics panel first when it was asked for"""
+    if not ENABLED:
+        return
+    ctx = get_script_run_ctx()
+    run = _active.get(_session_id(ctx))
+    if run is None:
+        return
+    if st.query_params.get(PANEL_QUERY_PARAM) in ("1", "true"):
+        diagnostics_panel(run)
+    _active.pop(_session_id(ctx), None)
+    _close_run(run, "ok", end=time.perf_counter())
+
+
+@contextlib.contextmanager
+def section(name):
+    """Time a named part of the page: @perf.section("name") or with perf.section("name")"""
+    if not ENABLED:
+        yield
+        return
+    ctx = get_script_run_ctx()
+    session = _session_id(ctx)
+    run = _active.get(session)
+    own_run = run is None
+    if own_run:
+        # A fragment rerun: the page script (and start_page) did not run
+        run = _active[session] = _open_run(ctx, _recent_page(ctx), "fragment")
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        end = time.perf_counter()
+        seconds, calls = run["sections"].get(name, (0.0, 0))
+        run["sections"][name] = (seconds + end - start, calls + 1)
+        run["last"] = end
+        if own_run and _active.get(session) is run:
+            _active.pop(session)
+            _close_run(run, "ok", end=end)
+
+
+def _recent_page(ctx):
+    """Page of the session's last full run, for labelling fragment reruns"""
+    session = _session_id(ctx)[:8]
+    with _lock:
+        for record in reversed(_recent):
+            if record["session"] == session and record["kind"] == "run":
+                return record["page"]
+    return "unknown"
+
+
+def recent_runs(page=None):
+    """Finished run records, oldest first, optionally only those of page"""
+    with _lock:
+        return [record for record in _recent if page is None or record["page"] == page]
+
+
+def section_summary(records):
+    """{section: (runs, mean ms, max ms)} over records"""
+    totals = {}
+    for record in records:
+        for name, timing in record["sections"].items():
+            totals.setdefault(name, []).append(timing["ms"])
+    return {name: (len(times), sum(times) / len(times), max(times)) for name, times in totals.items()}
+
+
+def diagnostics_panel(run):
+    """Sidebar summary of this page's recent reruns and the sections measured so far in this one"""
+    records = recent_runs(run["page"])[-20:]
+    with st.sidebar.expander("Diagnostics", expanded=True):
+        st.caption(f"Page '{run['page']}', this run so far: {(time.perf_counter() - run['started']) * 1000:.0f} ms, "
+                   f"{run['elements']} elements, {run['bytes'] / 1024:.1f} KB")
+        if not records:
+            st.caption("No finished reruns yet.")
+            return
+        rows = ["| kind | status | ms | elements | KB |", "|---|---|---:|---:|---:|"]
+        for record in reversed(records[-8:]):
+            rows.append(f"| {record['kind']} | {record['status']} | {record['ms']:.0f} | "
+                        f"{record['elements']} | {record['bytes'] / 1024:.1f} |")
+        st.markdown("\n".join(rows))
+        summary = section_summary(records)
+        if summary:
+            rows = ["| section | runs | mean ms | max ms |", "|---|---:|---:|---:|"]
+            for name, (count, mean, peak) in sorted(summary.items(), key=lambda item: -item[1][1]):
+                rows.append(f"| {name} | {count} | {mean:.1f} | {peak:.1f} |")
+            st.markdown("\n".join(rows))
+        if LOG_PATH:
+            st.caption(f"Logging to {LOG_PATH}")
@@ -0,0 +1,9 @@
+"""Psoriasis subtypes with descriptions and reference images by body location"""
+from cdss import knowledge
+
+
+def __getattr__(name):
+    """PSORIASIS_TYPES: types with reference images grouped by body location, from the current knowledge pack"""
+    if name == "PSORIASIS_TYPES":
+        return knowledge.load_pack()["psoriasis_types"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,261 @@
+"""Diagnostic screening matrix engine for the 19-question psoriasis screen
+
+Each question is answered yes/no and carries a signed weight. A patient's
+answers pack into a 19-bit integer (bit i is question i + 1), so whole
+registries score either with a vectorized weight dot product or with a
+lookup table over all 2**19 answer combinations.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+# Sections in display order; exclusion criteria carry negative weights
+SCREENING_SECTIONS = (
+    {"key": "primary", "title": "Section 1: Primary Clinical Features (Max: 12 points)"},
+    {"key": "pathognomonic", "title": "Section 2: Pathognomonic Signs (Max: 8 points)"},
+    {"key": "associated", "title": "Section 3: Associated Features (Max: 6 points)"},
+    {"key": "history", "title": "Section 4: Clinical History (Max: 8 points)"},
+    {"key": "symptom", "title": "Section 5: Symptom Characteristics (Max: 4 points)"},
+    {
+        "key": "exclusion",
+        "title": "Section 6: Exclusion Criteria (Negative Points)",
+        "warning": "⚠️ These features REDUCE likelihood of psoriasis and suggest alternative diagnoses"
+    }
+)
+SECTION_KEYS = tuple(section["key"] for section in SCREENING_SECTIONS)
+
+# Image questions show a reference picture with a caption; the others ask
+# a plain yes/no radio whose label is the prompt
+SCREENING_QUESTIONS = (
+    {
+        "number": 1,
+        "section": "primary",
+        "text": "Are plaques well-demarcated, thick, and red like these on elbows/knees/face areas?",
+        "image": "https://www.researchgate.net/publication/318736667/figure/fig7/AS:962699810852874@1606536929703/a-Plaque-psoriasis-elbow-b-Plaque-psoriasis-knee-c-Psoriasis-face-and-scalp.gif",
+        "caption": "Classic plaque psoriasis: Red/raised plaques, clear borders, silvery scales on elbows/knees/face.",
+        "weight": 3
+    },
+    {
+        "number": 2,
+        "section": "primary",
+        "text": "Are the scales silvery-white, thick, and easily scraped off, as shown?",
+        "image": "https://encrypted-tbn0.gstatic.com/images?q=tbn:ANd9GcSYTzhZh30dSIa6V-K7MjoCks5wTOjiwxBEPfn4zo7JycGSxW2PPQ950cYPOPdJSnRa9SM&usqp=CAU",
+        "caption": "Silvery, thick scale typical of psoriasis.",
+        "weight": 3
+    },
+    {
+        "number": 3,
+        "section": "primary",
+        "text": "Are lesions mainly on flexural or inverse (inside elbows/knees, wrists)?",
+        "image": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wCEAAkGBxMTEhUTExMVFhUXFxcaGBcYGBoaGBcYFxcXFxcXFxcYHSggGB0lHRcVITEhJSkrLi4uFx8zODMtNygtLisBCgoKDg0OFxAQGi0dHR0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0rLS0tLS0tLS0tLS0rLS0tLS0tLS0tLf/AABEIALcBEwMBIgACEQEDEQH/xAAbAAACAwEBAQAAAAAAAAAAAAADBAACBQEGB//EADsQAAIBAgMFBQQJBAIDAAAAAAABAgMRBCExEhNBUWEFcYGR8KGxwdEGFCIyQlJT4fEVFoKSorIjwuL/xAAZAQADAQEBAAAAAAAAAAAAAAAAAQIDBAX/xAAfEQEBAQACAgMBAQAAAAAAAAAAARECEhMhAzFRQWH/2gAMAwEAAhEDEQA/AM3YLqmNKHQvGicT1ySpnd1y8h1Uuh3dEgluTu66Dipk2eaDQSVF8jkqQ8qZ3ci02bujjomm6JTdBp4zt0clh7mjuSKiMsZjwxHQNR0Sjohp4ypUAEsObLoAqlAep6sOphxOrheR6CpQFqlANGPO1aT4q4s6MXwN+tQEa+EDT39ZqpLqXVMvOm0BdQfs/QqVhWvj0nsxW0+SNDDdmzq6txj/AMn+xt4HsmnTWUVfnbM048f1z8/k/nF42GDxNW1otLrl4mrg/ostaknJ8lkvmesVIuqRprDP1kYXsqEFaMUu74sep4Rch2EC6otj0YWVCxVuKNCOAvq2xmGDitEgNiqryg34HN1Vekbd7+R6KFGK1L7CAteZXZ1Z/iS8Gy67Fm9ZvyR6S8UWU0Mnm/6FL8z9nyIej210OAA1SL7hcx2NM6oLkcb0Ce47jroDm6O7HAVBLclXSH1TOKn0ERNUju5Hd0XjSFps50Tjw5pOkc3QabN3J36uaKpEdINGs50SkqJouIJ08w1WM10nxBVKZpTgLypBoxnTpC1Wmak4MG6KHoxj1KFxeeGNudEC6A9K8WHVwgjXwHE9JOgL1KI5U3ix6GKnDJpSXkzTwvaNOTtfZfKWXt0AVsOZuKoIuc6yvxx6qCQWMUeNwqrr7kpRXs8maawlaf36k33Oy9hfeM/FW7VxVOH3pxXe0Al27SWm1Lui/jZCeH7GS/CM/UUuAvIqfC5L6QcqU/Fpe64P+4pfpS/2/YY+o9PArLBC8lV4YD/cnOjLzXsLx+ksP0qn/F/+xPqC5HPqK5D8lHhiy+kNJ8Ki74/Jk/uChxnJd8JfBAJ4FchafZ9+A/Inwxof1uj+ovavY0Qy32YdH5C8T6VukX3QaNImw+PsMG4Kpd5dUQsIcQqgTSpR0ybAzKHmTYEAN3yLRgHUDqpiPS6gRwGZQOKAgWcTjgMKGZHTA4SlSzbKbodnEHsC1ekpwATpj1RAXANVCE6YOcR6ogDiGqJVIlJUh2rGwrUqJBp9dLVYCsoZDNWXPjwAypuXcVKixnVrvKJKHZd3d5s28PgDQpYVIrUYysP2ZbgPUsHbkPqlmFhR5hpEFhrnfqyXA1d0CVK+oaGbuCbnkaToL+DjpoNGseVDM5Kh0NZUuhzcoNDIeFzKVcMas6fgBcA08ZX1boQ0tjoQejHptmwXdZBIU0XSQ2dLxhzCTgFjTfMjT0JqdAsd3YXZCKIjL7otshtkigI9C2CrQykc3QhC6p2RxxGZg5IVVCkqZRQshuwCUCVaTlqClyD1I7N+YtBWXxE0kCqrzF6zssi+JxCS1zYlXrtRuwbceFLVqjvm8kZ1erndvwLOpKTd/IFCjd3KnFrlnofDJt56mxRw64oWwlC1h+nNaZ3HHNynv0Lh7PgHUClGFsl68BiD63sOVlYrTpXY3SpJHabyKzrBqXKrBSj5HYq4SMAAaRScHxDSVgcmGjFGB2gkZps5OHgCgG7gpJchhopNDBN+Ps+RBnY6kGb1cLZfDQIolZ0skldLoFVPgaY57YHs5l4pFowJUQrEqSR2EC6iXSIw5Q9jMjiEsVtxEaqR1riWaBVXkKnA5Mo0QsokLUmrC9WXIZqGfik1pxBXGaDUzEsZiEsuIxUlsrXhr1MPEXm8tOLFjq+P49+/oepKOurRk4mq5MPWqWyRWFkXxjo48eoMMNlmM0sPsq7WRelC/AYgry2bOy9o6XICnVz+1kuXE1Wktm0b3t4ccxDG0Yxkr89OY/QrXy5CY/JPUsGiEpR6HIQTG4U+gOWqQVysodBi1jiDSwKEWuJcuytrAAJnNi4zGB3dgZRUeRzd9RpxsTZAE5UykqPJjqgddIAR3BDRVIgxrWhAKo/wClF3T0GIyyNnPXJRI4kuVFQibONkTONkpS5CjZHImnHZTyASZZsGpCaReCOVaq0AuduPiZeLxeeT0zbJacOHatCvXSTuzKrYi+edvkDqYrbV/wAK9WM+vUcsr2XrIMdPD4s+zNavdGbPEt3XAJONlZeYpVaQ5xdPDjHKzutDlHTvKwk9X5HacuHE1zIs3RrW7gyf2rrRe8WilksvDmMzurPgtV8TK1nyDrS25q6fRmlhYW8hfD1E80M4OV+8nWPycvWfg1Cb29m2XM0uACjTtnxDoHNysv0tAkYF4wyJEaU3ZEg1ibAEHskcQkYhWkALKBR0xjdnNgABskjC4zsHNnwGNDcCHXBerkGDknkWUllcBKpYqqxsyNuRVsE5ZZkXQSUjfidRSL1XBcTspciaElIrVhpy49TrkBrV0TTiVZAK9ZRQGriMrmfVxDtd53JrbjxSti3st+mLUau0raLn11Fq15PoSbcVZcCXXxkk/wBXq1btxWghVfkgivblmXqxsrX/AJ4FRrPQdFvV+/hwuBxDW1bVZfG/rqElVSWfLQXTvnpe1vkaRc/Ukr93PTvIlx9wWvJNJLJad/N34A4ySd0g5U+NM4aEUrt5p6dfWYzCundPgrd4pUqJq6439h3DySWn7vwMajlx33XaUdhe0d7Lld7TWbM+M3OyaDSnUjNRWmQHePb1/a9TT0LxKRheNs1dBIrZWWYODDEEdgkUpzuEsNCqQRMsuRZIAGk73CRLJHbIZaHIslfMiLR7wwBKOZWasxixRxGNLsgWVFEA9hKpVSQPDRfgDhO+tsiVJ34m1RGhKaJvDPjWOfWRJxpOpwK79GbLEi9TE3Joxo1cUuApUrCcq4nicU9ETWnHiNXxO07Xy4iuLquWSdkLUU3K604t/ALWmllciurjxy+hcO+XL0wuXHX1YRjVydvMrtZa5LV8WGK6G5S4chTaT1d8/H0gk57S/L8lzFpOKy2vLzKkacZgVR5vT3lb2yf8esis69n8Csa18kjRem5abOS4hVTytwt68RCUmk3x4B8NW0V8zLkn+Cxgm78Pd3AsQ3HJaMPhstf4LzpbTS6knOWX25h4JbF3ZvgbVCN0nbR3uzNfZ+04t8DWw0Ps7Mlq/XcDP5OUs3WhF5ZMPBAKEFHyD25Mcjkq6iFggezzLyXUaXbl4IFBhYsMFXL2B3OxmNNc2Sxxslxlq7KORXeFXJcxBGiFHUIM3nHiOpSOI6mTGsVeINg1ZYgq8SZarMupiI/LEFHVE1ULJ3JVBauIyy9hahs6PxKRaSsTeJE1pMiuJbeSVoox0pNty0NWtVurCNeLsLHR8XyZ6M4W1r525A607NO2XIRwlaWYavVbSz9gYvc5LV698uv8C9Nq9lxerJHDt2u7e8PGCi9q/cUrvJMdWHV85ZhLWyy6W9xKkr6cdCUo3VlnYVrPd+w5xyB0U07jFdNZ8LAaV3FvjwIV2yGYyvkN0k9FrqIUItrPUfwc5XzWjFibyaeGr3SyH6V79BKlIbhUsORz8qaUg0ZiO8CQqjQfiy20JqZeVUEm7o45im9LQqgMMIsproLOqVjVAjbBvxAurmTeDIWVV6HJ1G/XwF3Li/eDdXkVhmXMgrvUQMgeCVYtCoZ9OYZVbG1QeUzu9EN9cq65OG0o1Tu+MzfvgjjlPoTiuzSeK4XKSxXIzN3J6trusEp0erDFdmgsSCqVnwV+8EqfeEhBhgnISguYXYRSKYZISuxOlGW1pkFxEXwzfIPZF1Ba2VxL8nvVaMPs/ayGKM48FYFTy1t4FnVQrE3mtPN2aKbCXQtvkVlUjzDrR2WhKwVJMXc1wZaFUfUuzTpVBqE0Y0cRmMwriwtaimi20IwrBI1QwjqqFlUEd6XhWDAc3hZVEJKuWdW2QYRpVkR1MhPbJvR4Du0VdVL1mJvEc2DlV43HhG51gTr3E51wU8RyHgP7whlPEevSOhhvHQjN8Ld4WNJ/mO4LBzc1Fy1u3ZcF+7Rv0+zIL8N+/M2vGsu0YaguTZdUW9IvyN10FwQWFIXUu7zyw8/yvyOpSWsZeT956RUkFp0rj6Qd3mFUWj/ctdHqqmFXTTxA08JD8q8l/Aug8jBpzDRN/wDp0H+CPkvig1Ls2GX2I/6/PIXQ/JHnk13jVLCVJaQfu956Klh4rRW9dBunb16+AeOJvyvP0Ow6j1aj7X5GjR+j8ErycpeNl7M/aakQqKnGRF+TkUo9k0Mr04+N5e+52p2Dh3pTgv8AFD0Sy9esimd5Vjv6OUlpCm/8I6d9kAxf0fp7LSo003dJqCVm1lLTgz0lOHr18yuKjeLy0z8hl2rxOCwdKSW1Th3bK8h3+i0Zfgt3OUfczlWGxWnHrtLuln79peBpUdBL7Vj4j6P0/wAMpx7pX/7pgH2HNfdqecLvzUkekVG4aNJC6weSz+vLR7MrrRwfjJfB+8L/AE/Efp37pR+LR62hhkGlHgiekHm5PFbuqtac/CLf/W5NqXGFT/SXxR7DdlZQF44rz15DfPk/Jo5v7HslTOqlYPHB57+PGPEEVR8peR7ONFBFQH0Hn/x4dRm9ITf+L+CLrCVnpTl5W957fckVIOkLz14uPZGIf4Uu+S+DZf8At2q9ZQXdd/BHst2UlArrE+bk8h/a8v1V/p/9nT12x0IHWF5eX6+YdnU//JLokvO/7GtJW9fIhCq0Bk8y8EQggJFB6aIQZGt109eYKlDNkIBadjTGKVPpw9cjpBEvKCyuHhSXh65nCAQqgi0LEIBLplpRZCDSkZMvvFo/XsIQA8x2/Ts6dTk9iXj91+DVv82NYR5IhBVc+jkQ9GJCAinIrIqzpBkpJZFCEEHYBmjhAC8IhlAhBlU2CtiEAKtFWjhACtiEIBP/2Q==",
+        "caption": "Flexural/inverse psoriasis.",
+        "weight": 3
+    },
+    {
+        "number": 4,
+        "section": "primary",
+        "text": "Are lesions symmetrical (same on both sides of the body)?",
+        "image": "https://edge.sitecorecloud.io/mmanual-ssq1ci05/media/professional/images/c/0/2/c0225511_psoriasis_of_the_elbows_science_photo_library_high.jpg?sc_lang=en&mw=828",
+        "caption": "Bilateral symmetry is typical for psoriasis.",
+        "weight": 3
+    },
+    {
+        "number": 5,
+        "section": "pathognomonic",
+        "text": "Does gentle scraping of scale cause pinpoint bleeding (Auspitz sign)?",
+        "image": "https://www.researchgate.net/publication/7073510/figure/fig1/AS:341128168656904@1458342701396/Auspitz-sign-multiple-pinpoint-bleeding-observed-on-scraping-the-scales-in-psoriasis.png",
+        "caption": "Auspitz sign: Pinpoint bleeding after removing scale - highly specific for psoriasis.",
+        "weight": 4
+    },
+    {
+        "number": 6,
+        "section": "pathognomonic",
+        "text": "Do new lesions appear along trauma/scratch lines (Koebner phenomenon)?",
+        "image": "https://img.medscapestatic.com/pi/meds/ckb/91/36191.jpg",
+        "caption": "Koebner phenomenon: Linear lesions at injury site - characteristic of active psoriasis.",
+        "weight": 4
+    },
+    {
+        "number": 7,
+        "section": "associated",
+        "text": "Are there changes in nails (pitting, thickening, yellow discoloration, separation)?",
+        "image": "https://www.jrheum.org/content/jrheum/48/8/1208/F2.large.jpg",
+        "caption": "Nail psoriasis: Pitting, onycholysis, thickening, oil-drop discoloration.",
+        "weight": 3
+    },
+    {
+        "number": 8,
+        "section": "associated",
+        "text": "Is there persistent, thick, scaly plaque on the scalp (possibly extending beyond hairline)?",
+        "image": "https://hips.hearstapps.com/hmg-prod/images/scalp-psoriasis-1525275705.jpg",
+        "caption": "Scalp psoriasis: Well-defined red plaques with scaling.",
+        "weight": 3
+    },
+    {
+        "number": 9,
+        "section": "history",
+        "text": "Have lesions lasted more than 6 weeks?",
+        "prompt": "Chronic duration (>6 weeks) supports psoriasis diagnosis:",
+        "weight": 2
+    },
+    {
+        "number": 10,
+        "section": "history",
+        "text": "Family history of psoriasis (parent, sibling, child)?",
+        "prompt": "30-40% of psoriasis patients have positive family history:",
+        "weight": 3
+    },
+    {
+        "number": 11,
+        "section": "history",
+        "text": "Did symptoms start at typical ages (20-30 or 50-60 years)?",
+        "prompt": "Psoriasis has two peak ages of onset:",
+        "weight": 2
+    },
+    {
+        "number": 12,
+        "section": "history",
+        "text": "Any recent triggers? (skin injury, stress, new medications, recent strep throat)",
+        "prompt": "Common psoriasis triggers:",
+        "weight": 1
+    },
+    {
+        "number": 13,
+        "section": "symptom",
+        "text": "Is itching mild or absent?",
+        "prompt": "Psoriasis typically causes mild itching (severe itching suggests eczema):",
+        "weight": 2
+    },
+    {
+        "number": 14,
+        "section": "symptom",
+        "text": "Are the patches thick, dry, and raised (not oozing/crusting)?",
+        "prompt": "Psoriasis lesions are dry and raised (oozing suggests eczema):",
+        "weight": 2
+    },
+    {
+        "number": 15,
+        "section": "exclusion",
+        "text": "Are lesions mainly on flexor areas (inside elbows/knees)?",
+        "prompt": "Flexor distribution suggests ECZEMA rather than psoriasis:",
+        "weight": -3
+    },
+    {
+        "number": 16,
+        "section": "exclusion",
+        "text": "Are lesions oozing, crusting, or weeping?",
+        "prompt": "Oozing/crusting suggests ECZEMA rather than psoriasis:",
+        "weight": -3
+    },
+    {
+        "number": 17,
+        "section": "exclusion",
+        "text": "Has a doctor found fungal infection by test (KOH/fungal culture)?",
+        "prompt": "Positive fungal test confirms TINEA infection:",
+        "weight": -5
+    },
+    {
+        "number": 18,
+        "section": "exclusion",
+        "text": "Is there a clear pattern matching a chemical/allergen exposure?",
+        "prompt": "Exposure pattern suggests CONTACT DERMATITIS:",
+        "weight": -2
+    },
+    {
+        "number": 19,
+        "section": "exclusion",
+        "text": "Is itching severe (especially at night)?",
+        "prompt": "Severe nocturnal itching suggests ECZEMA:",
+        "weight": -2
+    }
+)
+
+NUM_QUESTIONS = len(SCREENING_QUESTIONS)
+WEIGHTS = np.array([q["weight"] for q in SCREENING_QUESTIONS], dtype=np.int8)
+MAX_SCORE = int(WEIGHTS[WEIGHTS > 0].sum())
+
+# (19, 6) matrix holding each question's weight in its section column
+SECTION_WEIGHTS = np.array([
+    [q["weight"] if q["section"] == key else 0 for key in SECTION_KEYS]
+    for q in SCREENING_QUESTIONS
+], dtype=np.float32)
+
+# Bit value of each question in a packed answer mask
+QUESTION_BITS = 1 << np.arange(NUM_QUESTIONS, dtype=np.uint32)
+
+# Interpretation bands: total >= 18 high, >= 12 moderate, otherwise low
+BANDS = ("low", "moderate", "high")
+BAND_THRESHOLDS = np.array([12, 18])
+
+# Calls and rows scored since the process started, read by cdss.metrics
+stats = {"calls": 0, "rows": 0}
+
+
+def pack_answers(answers):
+    """Pack yes/no answers shaped (..., 19) into 19-bit integer masks"""
+    answers = np.asarray(answers, dtype=bool)
+    if answers.shape[-1] != NUM_QUESTIONS:
+        raise ValueError(f"expected {NUM_QUESTIONS} answers per patient, got {answers.shape[-1]}")
+    return (answers * QUESTION_BITS).sum(axis=-1, dtype=np.uint32)
+
+
+def unpack_masks(masks):
+    """Expand 19-bit answer masks into boolean answers shaped (..., 19)"""
+    masks = np.asarray(masks, dtype=np.uint32)
+    return (masks[..., np.newaxis] & QUESTION_BITS) != 0
+
+
+def _section_result(section_scores):
+    """Name the columns of a (..., 6) section score array"""
+    result = {key: section_scores[..., i] for i, key in enumerate(SECTION_KEYS)}
+    result["total_score"] = section_scores.sum(axis=-1, dtype=np.int16)
+    return result
+
+
+def score_answers(answers):
+    """Score yes/no answers shaped (..., 19) with a weight dot product
+
+    Returns a dict of int16 arrays: one per section key plus 'total_score'.
+    """
+    answers = np.asarray(answers, dtype=bool)
+    if answers.shape[-1] != NUM_QUESTIONS:
+        raise ValueError(f"expected {NUM_QUESTIONS} answers per patient, got {answers.shape[-1]}")
+    stats["calls"] += 1
+    stats["rows"] += answers.size // NUM_QUESTIONS
+    # float32 matmul is exact for these small integer weights
+    section_scores = answers.astype(np.float32) @ SECTION_WEIGHTS
+    return _section_result(section_scores.astype(np.int16))
+
+
+@lru_cache(maxsize=1)
+def score_table():
+    """(2**19, 7) int8 table of section scores and total for every answer mask
+
+    Built on first use (about 3.5 MB) and shared for the life of the process.
+    """
+    masks = np.arange(1 << NUM_QUESTIONS, dtype=np.uint32)
+    section_scores = (unpack_masks(masks).astype(np.float32) @ SECTION_WEIGHTS).astype(np.int8)
+    table = np.empty((len(masks), len(SECTION_KEYS) + 1), dtype=np.int8)
+    table[:, :-1] = section_scores
+    table[:, -1] = section_scores.sum(axis=1)
+    table.flags.writeable = False
+    return table
+
+
+def score_masks(masks):
+    """Score packed answer masks by table lookup
+
+    Returns the same dict as score_answers, with int8 arrays.
+    """
+    masks = np.asarray(masks, dtype=np.uint32)
+    stats["calls"] += 1
+    stats["rows"] += masks.size
+    rows = score_table()[masks]
+    result = {key: rows[..., i] for i, key in enumerate(SECTION_KEYS)}
+    result["total_score"] = rows[..., -1]
+    return result
+
+
+def classify(total_scores):
+    """Map total scores to band indices into BANDS (0 low, 1 moderate, 2 high)"""
+    return np.searchsorted(BAND_THRESHOLDS, total_scores, side="right").astype(np.int8)
@@ -0,0 +1,111 @@
+"""Shared page stylesheet, published once as a content-hashed static asset
+
+Every page used to inject its own <style> block (up to 4 KB) with each
+script run. The rules now live in cdss/styles.css, written once with
+duplicates merged; page-specific looks are modifier classes
+(.main-header.home) or rules scoped to the page marker that page_style()
+emits (.stApp:has(.page-registration) ...). The build minifies the sheet
+and publishes it under static/css/ with its content hash in the name:
+
+    python -m cdss.style build
+
+Pages call
+
+    st.markdown(style.page_style("home"), unsafe_allow_html=True)
+
+which emits a <link> to the hashed file, so the browser fetches and caches
+the sheet once and each rerun only carries the tag. Streamlit before 1.58
+serves .css from /app/static/ as text/plain, which browsers refuse to apply
+as a stylesheet; there the minified sheet is inlined instead.
+"""
+import argparse
+import os
+import re
+from functools import lru_cache
+
+from cdss import assets
+from cdss import fonts
+
+SOURCE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "styles.css")
+ASSET_NAME = "cdss.css"
+
+PAGES = ("home", "registration", "screening", "types", "severity")
+
+# First Streamlit release whose static endpoint serves .css as text/css
+LINK_MIN_VERSION = (1, 58)
+
+_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_TOKEN = re.compile(r"""("(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')|(\s+)""")
+
+# Whitespace next to these never matters (":" only after, so "a :hover" keeps its space)
+_TIGHT_BEFORE = "{};,>"
+_TIGHT_AFTER = "{};:,>"
+
+
+def minify(css):
+    """css without comments and insignificant whitespace; quoted strings are kept"""
+    css = _COMMENT.sub("", css)
+    out = []
+    pos = 0
+    for match in _TOKEN.finditer(css):
+        out.append(css[pos:match.start()])
+        quoted, space = match.groups()
+        if quoted:
+            out.append(quoted)
+        else:
+            before = out[-1][-1:] if out and out[-1] else ""
+            after = css[match.end():match.end() + 1]
+            if before and after and before not in _TIGHT_AFTER and after not in _TIGHT_BEFORE:
+                out.append(" ")
+        pos = match.end()
+    out.append(css[pos:])
+    return "".join(out).replace(";}", "}").strip()
+
+
+def compile_css(source=SOURCE_PATH):
+    """The served stylesheet: @font-face rules for the self-hosted fonts plus the minified source"""
+    with open(source, encoding="utf-8") as f:
+        return fonts.font_face_css() + minify(f.read())
+
+
+def build(source=SOURCE_PATH):
+    """Compile the stylesheet and publish it; returns the hashed path under static/"""
+    return assets.publish(compile_css(source).encode("utf-8"), ASSET_NAME, subdir="css")
+
+
+@lru_cache(maxsize=1)
+def stylesheet_tag():
+    """<link> to the published sheet, or the minified sheet inline where it cannot be linked"""
+    if ASSET_NAME in assets.load_manifest():
+        if assets.streamlit_version() >= LINK_MIN_VERSION:
+            return f'<link rel="stylesheet" href="{assets.static_url(ASSET_NAME)}">'
+        with open(assets.static_path(ASSET_NAME), encoding="utf-8") as f:
+            css = f.read()
+    else:
+        css = compile_css()
+    return f"<style>{css}</style>"
+
+
+def page_style(page):
+    """HTML for st.markdown: the shared stylesheet plus the marker that scopes page rules"""
+    if page not in PAGES:
+        raise ValueError(f"unknown page {page!r}; expected one of {', '.join(PAGES)}")
+    return f'{stylesheet_tag()}<div class="page-{page}"></div>'
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the shared page stylesheet")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("build", help="compile styles.css and publish it under static/css/")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        with open(SOURCE_PATH, "rb") as f:
+            source_size = len(f.read())
+        path = build()
+        size = os.path.getsize(os.path.join(assets.STATIC_DIR, path))
+        print(f"{ASSET_NAME} -> {assets.STATIC_URL_PREFIX}{path} ({source_size} -> {size} bytes)")
+
+
+if __name__ == "__main__":
+    main()
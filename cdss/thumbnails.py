@@ -0,0 +1,142 @@
+"""Right-sized, recompressed variants of cached reference images
+
+The galleries display images at a fixed width (300 px on Type
+Identification, 600 px on Diagnostic Screening), but the source files are
+often full-size JPEGs or GIFs. A variant is the image scaled down to the
+display width and re-encoded as WebP (animated GIFs stay animated). Variants
+are named after the content hash of the original plus the width, so a
+changed original gets a new variant and an unchanged one is never rebuilt:
+
+    <sha12 of original>.w300.webp
+
+Variants are built in the background after the first
+image_cache.local_image(url, width=...) call that needs one, and ahead of
+time by "python -m cdss.image_cache prefetch".
+"""
+import hashlib
+import io
+import os
+import threading
+
+# Display widths used by the pages
+GALLERY_WIDTH = 300
+SCREENING_WIDTH = 600
+VARIANT_WIDTHS = (GALLERY_WIDTH, SCREENING_WIDTH)
+
+VARIANT_FORMAT = "WEBP"
+VARIANT_EXTENSION = ".webp"
+QUALITY = 80
+
+# Encoder effort (0-6); 4 is Pillow's default speed/size balance
+WEBP_METHOD = 4
+
+HASH_LENGTH = 12
+
+_lock = threading.Lock()
+
+# path -> (inode, size, digest). image_cache touches originals on every hit,
+# so mtime is no use as a change marker; a refetch replaces the file with
+# os.replace, which gives it a new inode. One entry per cached file.
+_content_hashes = {}
+
+# (content hash, width) pairs whose variant came out no smaller than the original.
+# Entries go with their file's _content_hashes entry (see forget), so both stay
+# bounded by the number of cached files.
+_keep_original = set()
+
+
+def _file_digest(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:HASH_LENGTH]
+
+
+def content_hash(path):
+    """Short SHA-256 of a file's bytes, memoised per path until the file is replaced"""
+    info = os.stat(path)
+    entry = _content_hashes.get(path)
+    if entry is not None and entry[:2] == (info.st_ino, info.st_size):
+        return entry[2]
+    digest = _file_digest(path)
+    with _lock:
+        if entry is not None and entry[2] != digest:
+            _forget_digest(entry[2])
+        _content_hashes[path] = (info.st_ino, info.st_size, digest)
+    return digest
+
+
+def forget(path):
+    """Drop what is remembered about a cached file; image_cache calls this when it deletes one"""
+    with _lock:
+        entry = _content_hashes.pop(path, None)
+        if entry is not None:
+            _forget_digest(entry[2])
+
+
+def _forget_digest(digest):
+    _keep_original.difference_update([key for key in _keep_original if key[0] == digest])
+
+
+def variant_path(path, width):
+    """Where the width-px variant of the image at path is stored"""
+    return os.path.join(os.path.dirname(path), f"{content_hash(path)}.w{width}{VARIANT_EXTENSION}")
+
+
+def encode_variant(data, width):
+    """WebP bytes of image data scaled down to at most width pixels wide"""
+    from PIL import Image, ImageSequence
+
+    with Image.open(io.BytesIO(data)) as image:
+        frames = [frame.copy() for frame in ImageSequence.Iterator(image)]
+        durations = [frame.info.get("duration", image.info.get("duration", 100)) for frame in frames]
+        loop = image.info.get("loop", 0)
+
+    resized = []
+    for frame in frames:
+        frame = frame.convert("RGBA" if frame.mode in ("RGBA", "LA", "P") else "RGB")
+        if frame.width > width:
+            height = max(1, round(frame.height * width / frame.width))
+            frame = frame.resize((width, height), Image.LANCZOS)
+        resized.append(frame)
+
+    out = io.BytesIO()
+    options = {"quality": QUALITY, "method": WEBP_METHOD}
+    if len(resized) > 1:
+        options.update(save_all=True, append_images=resized[1:], duration=durations, loop=loop)
+    resized[0].save(out, VARIANT_FORMAT, **options)
+    return out.getvalue()
+
+
+def existing_variant(path, width):
+    """What build_variant would return, without building; None while the variant is still to be built"""
+    target = variant_path(path, width)
+    if os.path.exists(target):
+        return target
+    if (content_hash(path), width) in _keep_original:
+        return path
+    return None
+
+
+def build_variant(path, width):
+    """Path of the width-px variant of path, building it if needed
+
+    Returns the original path when the variant would not be smaller.
+    """
+    existing = existing_variant(path, width)
+    if existing is not None:
+        return existing
+    target = variant_path(path, width)
+    key = (content_hash(path), width)
+
+    with open(path, "rb") as f:
+        data = f.read()
+    encoded = encode_variant(data, width)
+    if len(encoded) >= len(data):
+        with _lock:
+            _keep_original.add(key)
+        return path
+
+    tmp_path = f"{target}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(encoded)
+    os.replace(tmp_path, target)
+    return target
@@ -0,0 +1,255 @@
+"""Treatment recommendation decision table
+
+generate_treatment_recommendations on the severity page derives three
+categories per patient. The rules are kept here as data so the same table
+classifies one patient (classify_patient) or a whole registry at once
+(classify_arrays / classify_cohort). Both raise ValueError for an age or
+disease duration that is missing (None or NaN) or infinite rather than
+guessing its category.
+
+The recommendation text for each category combination is prerendered
+once per process; render_recommendations only fills in the patient's age.
+"""
+import math
+
+import numpy as np
+
+SEVERITY_LEVELS = ("mild", "moderate", "severe")
+AGE_GROUPS = ("pediatric", "adult", "elderly")
+DURATION_CATEGORIES = ("new_onset", "established")
+
+# Severity: first row where PASI, BSA or DLQI reaches the threshold wins
+SEVERITY_RULES = (
+    ("severe", 10),
+    ("moderate", 5)
+)
+DEFAULT_SEVERITY = "mild"
+
+# Age group: (label, lower bound inclusive, upper bound exclusive)
+AGE_RULES = (
+    ("pediatric", -np.inf, 18),
+    ("adult", 18, 65),
+    ("elderly", 65, np.inf)
+)
+
+# Disease duration in years below which psoriasis counts as new onset
+NEW_ONSET_YEARS = 2
+
+COHORT_COLUMNS = ("pasi_score", "bsa_score", "dlqi_score", "age", "duration")
+
+# Calls and rows scored since the process started, read by cdss.metrics
+stats = {"calls": 0, "rows": 0}
+
+
+def _require_finite(name, value):
+    if value is None or not math.isfinite(value):
+        raise ValueError(f"{name} must be a finite number of years, got {value!r}")
+
+
+def _require_finite_array(name, values):
+    # Integer arrays are always finite; None in an object array becomes NaN
+    if values.dtype.kind not in "iub" and not np.isfinite(values.astype(float)).all():
+        raise ValueError(f"{name} must be a finite number of years for every patient")
+
+
+def classify_patient(pasi_score, bsa_score, dlqi_score, age, duration):
+    """Classify one patient; returns severity, age_group and duration_category labels"""
+    stats["calls"] += 1
+    stats["rows"] += 1
+    severity = DEFAULT_SEVERITY
+    for label, threshold in SEVERITY_RULES:
+        if pasi_score >= threshold or bsa_score >= threshold or dlqi_score >= threshold:
+            severity = label
+            break
+
+    _require_finite("age", age)
+    _require_finite("duration", duration)
+    age_group = next(label for label, low, high in AGE_RULES if low <= age < high)
+    duration_category = "new_onset" if duration < NEW_ONSET_YEARS else "established"
+
+    return {
+        'severity': severity,
+        'age_group': age_group,
+        'duration_category': duration_category
+    }
+
+
+def classify_arrays(pasi_score, bsa_score, dlqi_score, age, duration):
+    """Classify patients from equal-length arrays
+
+    Returns a dict of int8 code arrays indexing SEVERITY_LEVELS,
+    AGE_GROUPS and DURATION_CATEGORIES.
+    """
+    pasi_score, bsa_score, dlqi_score, age, duration = (
+        np.asarray(values) for values in (pasi_score, bsa_score, dlqi_score, age, duration)
+    )
+    _require_finite_array("age", age)
+    _require_finite_array("duration", duration)
+    stats["calls"] += 1
+    stats["rows"] += pasi_score.size
+
+    severity = np.select(
+        [(pasi_score >= t) | (bsa_score >= t) | (dlqi_score >= t) for _, t in SEVERITY_RULES],
+        [SEVERITY_LEVELS.index(label) for label, _ in SEVERITY_RULES],
+        default=SEVERITY_LEVELS.index(DEFAULT_SEVERITY)
+    ).astype(np.int8)
+
+    age_group = np.select(
+        [(age >= low) & (age < high) for _, low, high in AGE_RULES],
+        [AGE_GROUPS.index(label) for label, _, _ in AGE_RULES]
+    ).astype(np.int8)
+
+    duration_category = (duration >= NEW_ONSET_YEARS).astype(np.int8)
+
+    return {
+        'severity': severity,
+        'age_group': age_group,
+        'duration_category': duration_category
+    }
+
+
+def classify_cohort(patients):
+    """Classify every row of a DataFrame with COHORT_COLUMNS
+
+    Returns a DataFrame on the same index with categorical severity,
+    age_group and duration_category columns.
+    """
+    import pandas as pd
+
+    codes = classify_arrays(*(patients[column].to_numpy() for column in COHORT_COLUMNS))
+    return pd.DataFrame({
+        'severity': pd.Categorical.from_codes(codes['severity'], SEVERITY_LEVELS),
+        'age_group': pd.Categorical.from_codes(codes['age_group'], AGE_GROUPS),
+        'duration_category': pd.Categorical.from_codes(codes['duration_category'], DURATION_CATEGORIES)
+    }, index=patients.index)
+
+
+# Recommendation text blocks. "{age}" is the only field filled in per patient.
+AGE_NOTES = {
+    "pediatric": """\
+**Pediatric Considerations (Age: {age} years)**
+- **Topical therapy preferred:** First-line approach in children
+- **Limited systemic options:** Methotrexate and some biologics approved
+- **Weight-based dosing:** All medications require pediatric dosing
+- **Psychological support:** Important for school-age children
+- **Growth monitoring:** Required during systemic therapy
+""",
+    "elderly": """\
+**Elderly Considerations (Age: {age} years)**
+- **Comorbidity assessment:** Screen for cardiovascular, renal, hepatic conditions
+- **Drug interactions:** Review all concurrent medications
+- **Reduced starting doses:** Lower initial doses may be appropriate
+- **Enhanced monitoring:** More frequent safety assessments
+- **Infection risk:** Increased susceptibility to infections
+"""
+}
+
+# Severity-specific plan: (Streamlit alert kind, markdown)
+TREATMENT_PLANS = {
+    "mild": ("success", """\
+**First-line Treatment (Mild Psoriasis)**
+
+**Topical Therapy:**
+- Medium-potency corticosteroids
+- Vitamin D analogs (calcipotriol)
+- Combination products (calcipotriol/betamethasone)
+- Topical calcineurin inhibitors (face/flexures)
+
+**Adjunctive:**
+- Regular emollients and moisturizers
+- Lifestyle modifications
+"""),
+    "moderate": ("warning", """\
+**Treatment Options (Moderate Psoriasis)**
+
+**First-line:**
+- Optimize topical therapy
+- NB-UVB phototherapy
+- Consider systemic therapy if inadequate response
+
+**Systemic Options:**
+- Methotrexate 15-25mg weekly
+- Apremilast 30mg twice daily
+- Acitretin (if appropriate)
+"""),
+    "severe": ("error", """\
+**Treatment Options (Severe Psoriasis)**
+
+**Systemic therapy indicated:**
+- Biologic therapy preferred
+- Conventional systemics if biologics contraindicated
+- Combination approaches may be needed
+
+**Biologic Options:**
+- IL-17 inhibitors: Ixekizumab, Secukinumab
+- IL-23 inhibitors: Guselkumab, Risankizumab
+- TNF inhibitors: Adalimumab, Etanercept
+""")
+}
+
+MONITORING_NOTE = """\
+**Monitoring Requirements**
+
+**Baseline Assessment:**
+- Complete blood count
+- Comprehensive metabolic panel
+- Liver function tests
+- Infectious disease screening
+
+**Ongoing Monitoring:**
+- Clinical assessment every 4-12 weeks
+- Laboratory monitoring per medication
+- PASI assessment at each visit
+- Safety monitoring for adverse events
+"""
+
+TREATMENT_GOALS_NOTE = """\
+**Treatment Goals**
+
+**Primary Goals:**
+- PASI 75 response (75% improvement)
+- Absolute PASI ≤2-3 (almost clear skin)
+- DLQI improvement ≥5 points
+- Symptom relief (itch, pain)
+
+**Long-term Goals:**
+- Sustained disease control
+- Prevention of joint involvement
+- Improved quality of life
+- Minimal treatment burden
+"""
+
+
+def _build_recommendation_templates():
+    """Prerender the recommendation blocks for every category combination"""
+    templates = {}
+    for severity in SEVERITY_LEVELS:
+        for age_group in AGE_GROUPS:
+            for duration_category in DURATION_CATEGORIES:
+                templates[(severity, age_group, duration_category)] = {
+                    'age_note': AGE_NOTES.get(age_group),
+                    'plan': TREATMENT_PLANS[severity],
+                    'monitoring': MONITORING_NOTE,
+                    'goals': TREATMENT_GOALS_NOTE
+                }
+    return templates
+
+
+# All 3 x 3 x 2 = 18 (severity, age_group, duration_category) combinations
+RECOMMENDATION_TEMPLATES = _build_recommendation_templates()
+
+
+def render_recommendations(recommendations):
+    """Fill the prerendered template for a generate_treatment_recommendations result
+
+    Returns a dict with 'age_note' (markdown or None), 'plan' (alert kind,
+    markdown), 'monitoring' and 'goals' markdown.
+    """
+    template = RECOMMENDATION_TEMPLATES[(
+        recommendations['severity'],
+        recommendations['age_group'],
+        recommendations['duration_category']
+    )]
+    if template['age_note'] is None:
+        return template
+    return dict(template, age_note=template['age_note'].format(age=recommendations['age']))
@@ -1,223 +1,33 @@
 import streamlit as st
 from datetime import datetime
 
+from cdss import knowledge
+from cdss import metrics
+from cdss import perf
+from cdss import style
 
-# Professional CSS without emojis
-st.markdown("""
-<style>
-    * {
-        font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-    }
-    
-    .main-header {
-        background: linear-gradient(135deg, #1e3a5f 0%, #2d5a8c 100%);
-        color: white;
-        padding: 50px 40px;
-        border-radius: 8px;
-        text-align: center;
-        margin-bottom: 40px;
-        box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-    }
-    
-    .main-header h1 {
-        margin: 0;
-        font-size: 2.5em;
-        font-weight: 600;
-        letter-spacing: 0.5px;
-    }
-    
-    .main-header p {
-        margin: 10px 0 0 0;
-        font-size: 1.1em;
-        opacity: 0.95;
-    }
-    
-    .section-title {
-        font-size: 1.8em;
-        font-weight: 600;
-        color: #1e3a5f;
-        margin-top: 40px;
-        margin-bottom: 20px;
-        border-bottom: 3px solid #2d5a8c;
-        padding-bottom: 10px;
-    }
-    
-    .content-card {
-        background: #f8f9fa;
-        border-left: 5px solid #2d5a8c;
-        padding: 25px;
-        margin: 15px 0;
-        border-radius: 6px;
-        box-shadow: 0 2px 8px rgba(0,0,0,0.05);
-    }
-    
-    .definition-box {
-        background: white;
-        border: 1px solid #e0e6ed;
-        border-radius: 6px;
-        padding: 20px;
-        margin: 15px 0;
-    }
-    
-    .highlight-text {
-        color: #2d5a8c;
-        font-weight: 600;
-    }
-    
-    .feature-list {
-        list-style: none;
-        padding-left: 0;
-    }
-    
-    .feature-list li {
-        padding: 10px 0;
-        padding-left: 30px;
-        position: relative;
-        color: #333;
-        line-height: 1.6;
-    }
-    
-    .feature-list li:before {
-        content: "•";
-        position: absolute;
-        left: 0;
-        color: #2d5a8c;
-        font-weight: bold;
-        font-size: 1.2em;
-    }
-    
-    .type-box {
-        background: white;
-        border: 1px solid #e0e6ed;
-        border-radius: 6px;
-        padding: 20px;
-        box-shadow: 0 2px 8px rgba(0,0,0,0.05);
-        margin-bottom: 15px;
-    }
-    
-    .type-box h4 {
-        color: #2d5a8c;
-        margin-top: 0;
-        font-size: 1.1em;
-        border-bottom: 2px solid #e0e6ed;
-        padding-bottom: 10px;
-    }
-    
-    .type-box p {
-        margin: 10px 0;
-        color: #555;
-        line-height: 1.6;
-    }
-    
-    .patient-form {
-        background: #f0f4f8;
-        border: 1px solid #d0dce6;
-        border-radius: 6px;
-        padding: 30px;
-        margin: 20px 0;
-    }
-    
-    .form-title {
-        font-size: 1.5em;
-        font-weight: 600;
-        color: #1e3a5f;
-        margin-bottom: 25px;
-    }
-    
-    .form-section {
-        background: white;
-        border-left: 4px solid #2d5a8c;
-        padding: 20px;
-        margin: 20px 0;
-        border-radius: 4px;
-    }
-    
-    .form-section-title {
-        font-size: 1.15em;
-        font-weight: 600;
-        color: #1e3a5f;
-        margin-bottom: 15px;
-    }
-    
-    .nav-button-container {
-        text-align: center;
-        padding: 25px;
-        background: #f0f4f8;
-        border-radius: 8px;
-        border: 1px solid #d0dce6;
-        margin: 15px 0;
-    }
-    
-    .nav-button-title {
-        font-size: 1.2em;
-        font-weight: 600;
-        color: #1e3a5f;
-        margin-bottom: 15px;
-    }
-    
-    .nav-button-desc {
-        color: #555;
-        font-size: 0.95em;
-        margin-bottom: 20px;
-        line-height: 1.5;
-    }
-    
-    .info-box {
-        background: #e8f1f8;
-        border-left: 4px solid #2d5a8c;
-        padding: 15px 20px;
-        margin: 20px 0;
-        border-radius: 4px;
-    }
-    
-    .warning-box {
-        background: #fff3cd;
-        border-left: 4px solid #ff9800;
-        padding: 15px 20px;
-        margin: 20px 0;
-        border-radius: 4px;
-    }
-    
-    table {
-        width: 100%;
-        border-collapse: collapse;
-        margin: 20px 0;
-    }
-    
-    table th {
-        background: #2d5a8c;
-        color: white;
-        padding: 12px;
-        text-align: left;
-        font-weight: 600;
-    }
-    
-    table td {
-        border-bottom: 1px solid #e0e6ed;
-        padding: 12px;
-        color: #333;
-    }
-    
-    table tr:hover {
-        background: #f8f9fa;
-    }
-    
-    .tab-header {
-        font-size: 0.95em;
-        font-weight: 600;
-    }
-</style>
-""", unsafe_allow_html=True)
+from cdss.assessment import session_assessment
+
+
+# Rerun timing, element count and payload size; ?diagnostics=1 shows them (cdss/perf.py)
+# and /metrics on CDSS_METRICS_PORT exports them (cdss/metrics.py)
+metrics.start_exporter()
+perf.start_page("registration")
+
+# Shared stylesheet (cdss/styles.css); the page marker scopes page-specific rules
+st.markdown(style.page_style("registration"), unsafe_allow_html=True)
 
 # Initialize session state
 if 'page' not in st.session_state:
     st.session_state.page = 'home'
-if 'patient_info' not in st.session_state:
-    st.session_state.patient_info = {}
 
+# Patient details live on the session's assessment record, shared with the other pages
+assessment = session_assessment()
+
+@perf.section("introduction")
 def page_introduction():
     st.markdown("""
-    <div class="main-header">
+    <div class="main-header registration">
         <h1>Psoriasis Clinical Assessment System</h1>
         <p>Comprehensive Diagnostic and Severity Evaluation Platform</p>
     </div>
@@ -264,7 +74,7 @@ def page_introduction():
         st.markdown("""
         <div class="content-card">
             <h3 style="color: #1e3a5f; margin-top: 0;">Dermatological Features</h3>
-            <ul class="feature-list">
+            <ul class="feature-list registration">
                 <li>Well-demarcated erythematous plaques</li>
                 <li>Silvery-white scales easily scraped off</li>
                 <li>Auspitz sign: pinpoint bleeding after scale removal</li>
@@ -280,7 +90,7 @@ def page_introduction():
         st.markdown("""
         <div class="content-card">
             <h3 style="color: #1e3a5f; margin-top: 0;">Associated Systemic Features</h3>
-            <ul class="feature-list">
+            <ul class="feature-list registration">
                 <li>Psoriatic arthritis in 5-10% of cases</li>
                 <li>Increased metabolic syndrome risk</li>
                 <li>Elevated cardiovascular mortality</li>
@@ -297,28 +107,10 @@ def page_introduction():
     <div class="section-title">Epidemiology</div>
     """, unsafe_allow_html=True)
     
-    epidemiology_data = {
-        'Parameter': [
-            'Global Prevalence',
-            'Age of Onset - Early',
-            'Age of Onset - Late',
-            'Male to Female Ratio',
-            'Family History Present',
-            'Nail Involvement',
-            'Psoriatic Arthritis Development'
-        ],
-        'Value': [
-            '2-3% of population',
-            '20-30 years (Type 1)',
-            '50-60 years (Type 2)',
-            '1:1 (Equal)',
-            '30-40% of cases',
-            '50-80% of patients',
-            '5-10% of psoriasis patients'
-        ]
-    }
-    
-    st.table(epidemiology_data)
+    epidemiology_data = knowledge.load_pack()["epidemiology"]
+    
+    # The pack is read-only; st.table only lays out plain dicts as columns
+    st.table(dict(epidemiology_data))
     
     # Psoriasis Types
     st.markdown("""
@@ -428,9 +220,10 @@ def page_introduction():
     </div>
     """, unsafe_allow_html=True)
 
+@perf.section("patient_info")
 def page_patient_info():
     st.markdown("""
-    <div class="main-header">
+    <div class="main-header registration">
         <h1>Patient Information</h1>
         <p>Clinical Assessment Registration</p>
     </div>
@@ -445,27 +238,27 @@ def page_patient_info():
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        st.session_state.patient_info['patient_name'] = st.text_input(
+        assessment.patient_name = st.text_input(
             "Patient Name *",
-            value=st.session_state.patient_info.get('patient_name', ''),
+            value=assessment.patient_name,
             key="name_input"
         )
     
     with col2:
-        st.session_state.patient_info['patient_age'] = st.number_input(
+        assessment.patient_age = st.number_input(
             "Age (years) *",
             min_value=1,
             max_value=120,
-            value=st.session_state.patient_info.get('patient_age', 30),
+            value=assessment.patient_age,
             key="age_input"
         )
     
     with col3:
-        st.session_state.patient_info['patient_sex'] = st.selectbox(
+        assessment.patient_sex = st.selectbox(
             "Biological Sex *",
             ["Select", "Male", "Female", "Other"],
-            index=0 if st.session_state.patient_info.get('patient_sex', '') == '' else (
-                ["Select", "Male", "Female", "Other"].index(st.session_state.patient_info.get('patient_sex', 'Select'))
+            index=0 if assessment.patient_sex == '' else (
+                ["Select", "Male", "Female", "Other"].index(assessment.patient_sex)
             ),
             key="sex_input"
         )
@@ -479,14 +272,14 @@ def page_patient_info():
     col1, col2 = st.columns(2)
     
     with col1:
-        st.session_state.patient_info['patient_mrn'] = st.text_input(
+        assessment.patient_mrn = st.text_input(
             "Medical Record Number (Optional)",
-            value=st.session_state.patient_info.get('patient_mrn', ''),
+            value=assessment.patient_mrn,
             key="mrn_input"
         )
     
     with col2:
-        st.session_state.patient_info['assessment_date'] = st.date_input(
+        assessment.assessment_date = st.date_input(
             "Assessment Date",
             value=datetime.now(),
             key="date_input"
@@ -495,16 +288,16 @@ def page_patient_info():
     col1, col2 = st.columns(2)
     
     with col1:
-        st.session_state.patient_info['patient_contact'] = st.text_input(
+        assessment.patient_contact = st.text_input(
             "Contact Number (Optional)",
-            value=st.session_state.patient_info.get('patient_contact', ''),
+            value=assessment.patient_contact,
             key="contact_input"
         )
     
     with col2:
-        st.session_state.patient_info['patient_email'] = st.text_input(
+        assessment.patient_email = st.text_input(
             "Email (Optional)",
-            value=st.session_state.patient_info.get('patient_email', ''),
+            value=assessment.patient_email,
             key="email_input"
         )
     
@@ -514,20 +307,17 @@ def page_patient_info():
     """, unsafe_allow_html=True)
     
     # Form validation message
-    form_complete = (
-        st.session_state.patient_info.get('patient_name', '').strip() != '' and
-        st.session_state.patient_info.get('patient_age', 0) > 0 and
-        st.session_state.patient_info.get('patient_sex', '') != 'Select'
-    )
+    form_complete = assessment.patient_ready()
     
     if form_complete:
         st.success("Patient information complete. You can now proceed to select an assessment tool.")
     else:
         st.warning("Please complete all required fields (marked with *) to proceed.")
 
+@perf.section("tool_selection")
 def page_tool_selection():
     st.markdown("""
-    <div class="main-header">
+    <div class="main-header registration">
         <h1>Assessment Tools</h1>
         <p>Select Clinical Evaluation Module</p>
     </div>
@@ -541,18 +331,14 @@ def page_tool_selection():
     """, unsafe_allow_html=True)
     
     # Check if patient info is provided
-    patient_ready = (
-        st.session_state.patient_info.get('patient_name', '').strip() != '' and
-        st.session_state.patient_info.get('patient_age', 0) > 0 and
-        st.session_state.patient_info.get('patient_sex', '') != 'Select'
-    )
+    patient_ready = assessment.patient_ready()
     
     if patient_ready:
         st.markdown(f"""
         <div class="info-box">
-            <strong>Patient:</strong> {st.session_state.patient_info.get('patient_name', 'Unknown')} | 
-            <strong>Age:</strong> {st.session_state.patient_info.get('patient_age', 'N/A')} years | 
-            <strong>Sex:</strong> {st.session_state.patient_info.get('patient_sex', 'N/A')}
+            <strong>Patient:</strong> {assessment.patient_name} | 
+            <strong>Age:</strong> {assessment.patient_age} years | 
+            <strong>Sex:</strong> {assessment.patient_sex}
         </div>
         """, unsafe_allow_html=True)
     else:
@@ -616,7 +402,7 @@ with tab3:
 # Handle page navigation for assessment modules
 if st.session_state.page == 'diagnosis':
     st.markdown("""
-    <div class="main-header">
+    <div class="main-header registration">
         <h1>Diagnostic Screening</h1>
         <p>Clinical assessment module</p>
     </div>
@@ -627,7 +413,7 @@ if st.session_state.page == 'diagnosis':
         st.rerun()
 elif st.session_state.page == 'type':
     st.markdown("""
-    <div class="main-header">
+    <div class="main-header registration">
         <h1>Type Identification</h1>
         <p>Psoriasis subtype classification module</p>
     </div>
@@ -638,7 +424,7 @@ elif st.session_state.page == 'type':
         st.rerun()
 elif st.session_state.page == 'severity':
     st.markdown("""
-    <div class="main-header">
+    <div class="main-header registration">
         <h1>Severity Assessment</h1>
         <p>PASI, BSA, and DLQI evaluation module</p>
     </div>
@@ -647,3 +433,5 @@ elif st.session_state.page == 'severity':
     if st.button("Return to Main Navigation"):
         st.session_state.page = 'home'
         st.rerun()
+
+perf.end_page()
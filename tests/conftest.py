@@ -0,0 +1,21 @@
+import io
+
+import pytest
+from PIL import Image
+
+from cdss import image_cache
+
+
+@pytest.fixture
+def cache_reference_image(tmp_path, monkeypatch):
+    """Point the image cache at tmp_path; returns a function that puts a full-size PNG for a URL in it"""
+    monkeypatch.setattr(image_cache, "CACHE_DIR", str(tmp_path))
+
+    def cache(url):
+        image = Image.linear_gradient("L").resize((1200, 900)).convert("RGB")
+        out = io.BytesIO()
+        image.save(out, "PNG")
+        path = tmp_path / (image_cache.url_key(url) + ".png")
+        path.write_bytes(out.getvalue())
+        return str(path)
+    return cache
@@ -0,0 +1,66 @@
+import pickle
+from datetime import date
+
+import pytest
+
+from cdss import bsa, dlqi, screening
+from cdss.assessment import Assessment
+
+
+def filled():
+    record = Assessment()
+    record.patient_name = "Zoë Łukasiewicz-Ñúñez 患者"
+    record.patient_age = 67
+    record.patient_sex = "Female"
+    record.patient_mrn = "MRN004211"
+    record.patient_email = "zoë@example.org"
+    record.assessment_date = date(2024, 2, 29)
+    record.disease_duration = 12
+    record.set_pasi_row(0, [4, 3, 2, 90])
+    record.set_pasi_row(3, [1, 1, 0, 5])
+    record.pasi_total = 17.3
+    record.set_bsa_affected([10, 0, 25, 40] + [0] * (len(bsa.BODY_REGIONS) - 4))
+    record.bsa_score = 12.5
+    record.set_dlqi_answers([3, dlqi.UNANSWERED] + [1] * (len(dlqi.DLQI_QUESTIONS) - 2))
+    record.dlqi_score = 12
+    for number in (1, 7, screening.NUM_QUESTIONS):
+        record.set_screening_answer(number, True)
+    record.identified_types = ("Plaque Psoriasis", "Guttate Psoriasis")
+    return record
+
+
+@pytest.mark.parametrize("record", [Assessment(), filled()], ids=["blank", "filled"])
+def test_round_trip(record):
+    copy = Assessment.from_bytes(record.to_bytes())
+    assert copy == record
+    assert pickle.loads(pickle.dumps(record)) == record
+    for name in Assessment.__slots__:
+        assert getattr(copy, name) == getattr(record, name)
+
+
+def test_blank_fields_survive_the_round_trip():
+    copy = Assessment.from_bytes(Assessment().to_bytes())
+    assert copy.pasi_total is None
+    assert copy.assessment_date is None
+    assert copy.identified_types == ()
+    assert list(copy.dlqi) == [dlqi.UNANSWERED] * len(dlqi.DLQI_QUESTIONS)
+
+
+def test_filled_fields_survive_the_round_trip():
+    copy = Assessment.from_bytes(filled().to_bytes())
+    assert copy.patient_name == "Zoë Łukasiewicz-Ñúñez 患者"
+    assert copy.assessment_date == date(2024, 2, 29)
+    assert copy.identified_types == ("Plaque Psoriasis", "Guttate Psoriasis")
+    assert [copy.screening_answer(n) for n in (1, 2, 7, screening.NUM_QUESTIONS)] == [True, False, True, True]
+
+
+def test_unknown_format_version_is_rejected():
+    data = bytearray(Assessment().to_bytes())
+    data[0] += 1
+    with pytest.raises(ValueError):
+        Assessment.from_bytes(bytes(data))
+
+
+def test_assessments_are_unhashable():
+    with pytest.raises(TypeError):
+        hash(Assessment())
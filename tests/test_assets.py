@@ -0,0 +1,17 @@
+import os
+
+from cdss import assets, image_cache
+
+
+def test_images_are_static_urls_where_streamlit_serves_them(monkeypatch):
+    monkeypatch.setattr(assets, "streamlit_version", lambda: assets.IMAGE_URL_MIN_VERSION)
+    source = assets.image_source(image_cache.PLACEHOLDER_ASSET)
+    assert source == assets.static_url(image_cache.PLACEHOLDER_ASSET)
+    assert source.startswith(assets.STATIC_URL_PREFIX)
+
+
+def test_images_are_files_on_older_streamlit(monkeypatch):
+    monkeypatch.setattr(assets, "streamlit_version", lambda: (1, 37))
+    source = assets.image_source(image_cache.PLACEHOLDER_ASSET)
+    assert source == assets.static_path(image_cache.PLACEHOLDER_ASSET)
+    assert os.path.isfile(source)
@@ -0,0 +1,77 @@
+import math
+
+import numpy as np
+import pytest
+
+from cdss import dlqi
+
+# (domain, special) per question, as the DLQI page listed them before the engine
+BASELINE_QUESTIONS = (
+    ("Symptoms and Feelings", False),
+    ("Symptoms and Feelings", False),
+    ("Daily Activities", False),
+    ("Daily Activities", False),
+    ("Leisure", False),
+    ("Leisure", False),
+    ("Work/School", True),
+    ("Personal Relationships", True),
+    ("Personal Relationships", True),
+    ("Treatment", True),
+)
+
+
+def baseline_dlqi(answers):
+    """The page's scoring loop: (total, answered count, totals of domains with an answer)"""
+    total, answered, domain_scores = 0, 0, {}
+    for (domain, special), answer in zip(BASELINE_QUESTIONS, answers):
+        domain_scores.setdefault(domain, [])
+        if answer is None:
+            continue
+        answered += 1
+        score = (0 if answer == 0 else answer - 1) if special else answer
+        total += score
+        domain_scores[domain].append(score)
+    return total, answered, {domain: sum(scores) for domain, scores in domain_scores.items() if scores}
+
+
+def engine_dlqi(answers):
+    result = dlqi.score_dlqi([[dlqi.UNANSWERED if answer is None else answer for answer in answers]])
+    domain_totals = {
+        domain: int(result['domain_scores'][0, j])
+        for j, domain in enumerate(result['domains'])
+        if result['domain_answered'][0, j]
+    }
+    return int(result['total'][0]), int(result['answered'][0]), domain_totals
+
+
+def test_questionnaire_matches_the_page():
+    assert [(q["domain"], bool(q.get("special"))) for q in dlqi.DLQI_QUESTIONS] == list(BASELINE_QUESTIONS)
+
+
+@pytest.mark.parametrize("answers", [
+    [None] * 10,
+    [0] * 10,
+    [3] * 10,
+    [3, 3, 3, 3, 3, 3, 0, 0, 0, 0],
+    [None, 2, None, 1, 0, None, 1, 3, None, 2],
+    [1, None, None, None, None, None, None, None, None, None],
+    [None, None, None, None, None, None, 0, None, None, 3],
+], ids=["blank", "zeros", "max", "not-relevant", "partial", "one", "special-only"])
+def test_scores_match_the_page_loop(answers):
+    assert engine_dlqi(answers) == baseline_dlqi(answers)
+
+
+def test_random_questionnaires_match_the_page_loop():
+    rng = np.random.default_rng(0)
+    options = rng.integers(-1, 4, (300, len(BASELINE_QUESTIONS)))
+    result = dlqi.score_dlqi(options)
+    for row, total, answered in zip(options.tolist(), result['total'], result['answered']):
+        expected_total, expected_answered, _ = baseline_dlqi([None if o < 0 else o for o in row])
+        assert (total, answered) == (expected_total, expected_answered)
+
+
+def test_nan_counts_as_unanswered():
+    answers = [math.nan, 2, 1, math.nan, 0, 0, 0, 2, math.nan, 1]
+    result = dlqi.score_dlqi([answers])
+    assert (int(result['total'][0]), int(result['answered'][0])) == baseline_dlqi(
+        [None if a != a else int(a) for a in answers])[:2]
@@ -0,0 +1,97 @@
+import os
+import threading
+import urllib.error
+
+from cdss import assets, image_cache, thumbnails
+
+
+def test_miss_returns_placeholder_and_fetches_in_background(tmp_path, monkeypatch):
+    url = "https://example.org/plaque.png"
+    monkeypatch.setattr(image_cache, "CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(image_cache, "OFFLINE", False)
+    release, fetched = threading.Event(), threading.Event()
+
+    def slow_fetch(fetch_url, timeout=image_cache.FETCH_TIMEOUT):
+        release.wait(5)
+        fetched.set()
+        raise ValueError(f"not an image: {fetch_url}")
+
+    monkeypatch.setattr(image_cache, "fetch", slow_fetch)
+
+    # Returns while the fetch is still blocked, and queues the URL only once
+    placeholder = assets.image_source(image_cache.PLACEHOLDER_ASSET)
+    assert image_cache.local_image(url) == placeholder
+    assert image_cache.local_image(url) == placeholder
+    assert image_cache._pending == {(url, None)}
+    release.set()
+    assert fetched.wait(5)
+
+
+def test_network_failure_pauses_every_fetch(tmp_path, monkeypatch):
+    monkeypatch.setattr(image_cache, "CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(image_cache, "OFFLINE", False)
+    monkeypatch.setattr(image_cache, "_breaker", {"open_until": 0.0})
+    attempts = []
+    done = threading.Event()
+
+    def unreachable(url, timeout=image_cache.FETCH_TIMEOUT):
+        attempts.append(url)
+        done.set()
+        raise urllib.error.URLError("network is unreachable")
+
+    monkeypatch.setattr(image_cache, "fetch", unreachable)
+
+    image_cache.local_image("https://example.org/first.png")
+    assert done.wait(5)
+    for name in ("second", "third"):
+        image_cache.local_image(f"https://example.org/{name}.png")
+
+    assert attempts == ["https://example.org/first.png"]
+    assert image_cache._breaker["open_until"] > 0
+
+
+def test_file_evicted_during_lookup_is_a_miss(tmp_path, monkeypatch):
+    url = "https://example.org/plaque.png"
+    monkeypatch.setattr(image_cache, "CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(image_cache, "OFFLINE", True)
+    path = tmp_path / (image_cache.url_key(url) + ".png")
+    path.write_bytes(b"\x89PNG\r\n\x1a\n")
+    placeholder = assets.image_source(image_cache.PLACEHOLDER_ASSET)
+
+    # Removed after cached_path found it, before the touch
+    cached_path = image_cache.cached_path
+
+    def found_then_evicted(lookup_url):
+        found = cached_path(lookup_url)
+        os.remove(found)
+        return found
+
+    monkeypatch.setattr(image_cache, "cached_path", found_then_evicted)
+    assert image_cache.local_image(url) == placeholder
+    monkeypatch.setattr(image_cache, "cached_path", cached_path)
+
+    # Removed while the variant was being built
+    path.write_bytes(b"\x89PNG\r\n\x1a\n")
+
+    def evicted(original, width):
+        os.remove(original)
+        raise FileNotFoundError(original)
+
+    monkeypatch.setattr(thumbnails, "existing_variant", evicted)
+    assert image_cache.local_image(url, width=thumbnails.GALLERY_WIDTH) == placeholder
+
+
+def test_variant_is_built_off_the_page_thread(cache_reference_image, monkeypatch):
+    url = "https://example.org/plaque.png"
+    monkeypatch.setattr(thumbnails, "_content_hashes", {})
+    path = cache_reference_image(url)
+    encoded_on = []
+    encode_variant = thumbnails.encode_variant
+    monkeypatch.setattr(thumbnails, "encode_variant",
+                        lambda data, width: encoded_on.append(threading.current_thread()) or encode_variant(data, width))
+
+    # The first hit serves the original and leaves the encoding to the worker
+    assert image_cache.local_image(url, width=thumbnails.GALLERY_WIDTH) == path
+    image_cache._fetch_queue.join()
+    assert encoded_on and threading.current_thread() not in encoded_on
+    assert image_cache.local_image(url, width=thumbnails.GALLERY_WIDTH).endswith(f".w{thumbnails.GALLERY_WIDTH}.webp")
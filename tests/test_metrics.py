@@ -0,0 +1,21 @@
+import os
+import subprocess
+import sys
+
+from cdss import metrics, pasi
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_importing_metrics_leaves_the_engines_unloaded():
+    check = ("import sys, cdss.metrics, cdss.perf, cdss.style; "
+             "print(sorted(name for name in sys.modules if name in ('numpy', 'cdss.pasi', 'cdss.treatment')))")
+    result = subprocess.run([sys.executable, "-c", check], capture_output=True, text=True, check=True,
+                            env={"CDSS_METRICS_PORT": "0", "PYTHONPATH": ROOT_DIR})
+    assert result.stdout.strip() == "[]"
+
+
+def test_loaded_engines_are_exported():
+    pasi.score_pasi([[1, 2, 3, 40]] * len(pasi.REGIONS))
+    lines = metrics.render().splitlines()
+    assert any(line.startswith('cdss_engine_calls_total{engine="pasi"}') for line in lines)
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from cdss import pasi
+
+
+def baseline_area_score(percentage):
+    """convert_area_to_score as the severity page had it before the engine"""
+    if percentage == 0:
+        return 0
+    elif percentage < 10:
+        return 1
+    elif percentage <= 29:
+        return 2
+    elif percentage <= 49:
+        return 3
+    elif percentage <= 69:
+        return 4
+    elif percentage <= 89:
+        return 5
+    else:
+        return 6
+
+
+AREA_BOUNDARIES = [0, 1, 9, 10, 29, 30, 49, 50, 69, 70, 89, 90, 100]
+FRACTIONAL = [0.0, 0.5, 9.5, 9.99, 10.0, 29.0, 29.5, 49.01, 69.9, 89.0, 89.5, 99.9, 100.0]
+
+
+@pytest.mark.parametrize("percentage", AREA_BOUNDARIES + FRACTIONAL)
+def test_area_score_matches_the_page_formula(percentage):
+    expected = baseline_area_score(percentage)
+    assert pasi.area_score(percentage) == expected
+    assert pasi.area_to_score([percentage])[0] == expected
+
+
+def test_area_to_score_covers_every_whole_percentage():
+    assert pasi.area_to_score(np.arange(101)).tolist() == [baseline_area_score(p) for p in range(101)]
+    assert pasi.area_to_score(np.arange(101, dtype=float)).tolist() == [baseline_area_score(p) for p in range(101)]
+
+
+def test_total_pasi_matches_the_page_formula():
+    rng = np.random.default_rng(0)
+    assessments = rng.integers(0, 5, (500, len(pasi.REGIONS), len(pasi.COMPONENTS)))
+    assessments[:, :, pasi.AREA] = rng.choice(AREA_BOUNDARIES, (500, len(pasi.REGIONS)))
+
+    result = pasi.score_pasi(assessments)
+    for patient, total in zip(assessments.tolist(), result['total_pasi']):
+        expected = 0.0
+        for weight, (erythema, induration, scaling, area) in zip(pasi.REGION_WEIGHTS, patient):
+            expected += weight * (erythema + induration + scaling) * baseline_area_score(area)
+        assert total == expected
+
+
+def test_maximum_pasi_is_72():
+    assert pasi.score_pasi([[4, 4, 4, 100]] * len(pasi.REGIONS))['total_pasi'][0] == pytest.approx(72.0)
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from cdss import screening
+
+# Question weights of the screening page before the engine, q1-q19
+BASELINE_WEIGHTS = (3, 3, 3, 3, 4, 4, 3, 3, 2, 3, 2, 1, 2, 2, -3, -3, -5, -2, -2)
+
+
+def baseline_total(answers):
+    return sum(weight for weight, answer in zip(BASELINE_WEIGHTS, answers) if answer)
+
+
+def baseline_band(total):
+    """The page's interpretation: >= 18 high, >= 12 moderate, otherwise low"""
+    if total >= 18:
+        return "high"
+    elif total >= 12:
+        return "moderate"
+    return "low"
+
+
+def answers_for(*numbers):
+    return [number in numbers for number in range(1, screening.NUM_QUESTIONS + 1)]
+
+
+def test_weights_match_the_page():
+    assert tuple(screening.WEIGHTS.tolist()) == BASELINE_WEIGHTS
+    assert screening.MAX_SCORE == 38
+
+
+@pytest.mark.parametrize("numbers, total", [
+    ((1, 2, 3, 4, 12, 18), 11),
+    ((1, 2, 3, 4), 12),
+    ((1, 2, 3, 4, 5, 12), 17),
+    ((1, 2, 3, 4, 5, 9), 18),
+])
+def test_band_boundaries(numbers, total):
+    answers = answers_for(*numbers)
+    assert baseline_total(answers) == total
+    for scored in (screening.score_answers([answers]), screening.score_masks(screening.pack_answers([answers]))):
+        assert int(scored['total_score'][0]) == total
+        assert screening.BANDS[screening.classify(scored['total_score'])[0]] == baseline_band(total)
+
+
+def test_random_answers_match_the_page():
+    answers = np.random.default_rng(0).random((1000, screening.NUM_QUESTIONS)) < 0.5
+    totals = screening.score_answers(answers)['total_score']
+    assert totals.tolist() == [baseline_total(row) for row in answers.tolist()]
+    assert screening.score_masks(screening.pack_answers(answers))['total_score'].tolist() == totals.tolist()
+    assert [screening.BANDS[band] for band in screening.classify(totals)] == [baseline_band(t) for t in totals.tolist()]
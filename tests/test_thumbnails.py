@@ -0,0 +1,54 @@
+from cdss import image_cache, thumbnails
+
+
+def test_repeated_lookups_hash_the_original_once(cache_reference_image, monkeypatch):
+    url = "https://example.org/plaque.png"
+    monkeypatch.setattr(thumbnails, "_content_hashes", {})
+    path = cache_reference_image(url)
+
+    hashed = []
+    file_digest = thumbnails._file_digest
+    monkeypatch.setattr(thumbnails, "_file_digest", lambda p: hashed.append(p) or file_digest(p))
+
+    # The first lookup serves the original while the worker builds the variant
+    assert image_cache.local_image(url, width=thumbnails.GALLERY_WIDTH) == path
+    image_cache._fetch_queue.join()
+    sources = {image_cache.local_image(url, width=thumbnails.GALLERY_WIDTH) for _ in range(5)}
+
+    assert hashed == [path]
+    assert list(thumbnails._content_hashes) == [path]
+    assert len(sources) == 1 and sources.pop().endswith(f".w{thumbnails.GALLERY_WIDTH}.webp")
+
+
+def test_replaced_original_is_hashed_again(tmp_path, monkeypatch):
+    monkeypatch.setattr(thumbnails, "_content_hashes", {})
+    path = tmp_path / "original.png"
+    path.write_bytes(b"first")
+    first = thumbnails.content_hash(str(path))
+
+    replacement = tmp_path / "original.png.tmp"
+    replacement.write_bytes(b"other")
+    replacement.replace(path)
+
+    assert thumbnails.content_hash(str(path)) != first
+    assert len(thumbnails._content_hashes) == 1
+
+
+def test_evicted_originals_are_forgotten(tmp_path, monkeypatch):
+    monkeypatch.setattr(image_cache, "CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(thumbnails, "_content_hashes", {})
+    monkeypatch.setattr(thumbnails, "_keep_original", set())
+    # A variant no smaller than its original keeps the original
+    monkeypatch.setattr(thumbnails, "encode_variant", lambda data, width: data + b"larger")
+    paths = []
+    for n in range(3):
+        path = tmp_path / f"original{n}.png"
+        path.write_bytes(b"image %d" % n)
+        paths.append(str(path))
+    for path in paths:
+        assert thumbnails.build_variant(path, thumbnails.GALLERY_WIDTH) == path
+    assert len(thumbnails._keep_original) == 3
+
+    assert image_cache.evict(max_bytes=0) == 3
+    assert thumbnails._content_hashes == {}
+    assert thumbnails._keep_original == set()
@@ -0,0 +1,48 @@
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cdss import treatment
+
+
+@pytest.mark.parametrize("age", [None, math.nan, math.inf])
+def test_missing_age_is_rejected_by_every_path(age):
+    with pytest.raises(ValueError):
+        treatment.classify_patient(12, 8, 6, age, 3)
+    with pytest.raises(ValueError):
+        treatment.classify_arrays([12, 4], [8, 2], [6, 1], [40, age], [3, 1])
+    cohort = pd.DataFrame({"pasi_score": [12.0], "bsa_score": [8.0], "dlqi_score": [6],
+                           "age": [age], "duration": [3]})
+    with pytest.raises(ValueError):
+        treatment.classify_cohort(cohort)
+
+
+def test_scalar_and_array_paths_agree():
+    ages = [0, 17, 17.9, 18, 64, 65, 90]
+    codes = treatment.classify_arrays(np.zeros(len(ages)), np.zeros(len(ages)), np.zeros(len(ages)),
+                                      ages, np.ones(len(ages)))
+    expected = [treatment.classify_patient(0, 0, 0, age, 1)["age_group"] for age in ages]
+    assert [treatment.AGE_GROUPS[code] for code in codes["age_group"]] == expected
+
+
+@pytest.mark.parametrize("duration", [None, math.nan, math.inf])
+def test_missing_duration_is_rejected_by_every_path(duration):
+    with pytest.raises(ValueError):
+        treatment.classify_patient(12, 8, 6, 40, duration)
+    with pytest.raises(ValueError):
+        treatment.classify_arrays([12, 4], [8, 2], [6, 1], [40, 50], [3, duration])
+    cohort = pd.DataFrame({"pasi_score": [12.0], "bsa_score": [8.0], "dlqi_score": [6],
+                           "age": [40], "duration": [duration]})
+    with pytest.raises(ValueError):
+        treatment.classify_cohort(cohort)
+
+
+def test_duration_categories_agree_between_paths():
+    durations = [0, 1, 1.9, 2, 2.5, 30]
+    n = len(durations)
+    codes = treatment.classify_arrays(np.zeros(n), np.zeros(n), np.zeros(n), np.full(n, 40), durations)
+    expected = [treatment.classify_patient(0, 0, 0, 40, duration)["duration_category"] for duration in durations]
+    assert [treatment.DURATION_CATEGORIES[code] for code in codes["duration_category"]] == expected
+    assert expected == ["new_onset"] * 3 + ["established"] * 3